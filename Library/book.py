@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List
+import sys
+from typing import List, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -9,6 +9,8 @@ class BookInterface(ABC):
     Defines the common properties and methods that any book-related class must implement.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def title(self) -> str:
@@ -33,24 +35,25 @@ class BookInterface(ABC):
         """Get a list of special features for the book."""
         pass
 
+    @abstractmethod
+    def description_lines(self) -> List[str]:
+        """Get the description as a fresh list of lines that the caller may extend."""
+        pass
+
 
 class Book(BookInterface):
     """
     Represents a book in the library management system.
     Implements the BookInterface for compatibility with decorators.
     """
-    title: str
-    author: str
-    copies: int
-    genre: str
-    year: int
-    loaned_copies: int = 0
-    total_borrows: int = 0
 
-    """
-    Represents a book in the library management system.
-    Implements the BookInterface for compatibility with decorators.
-    """
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute loads in sort keys
+    __slots__ = ('_title', '_author', '_genre', '_title_lower', '_sort_author', '_genre_lower',
+                 'year', 'copies', 'loaned_copies', 'available_copies', 'total_borrows')
+
+    # Column order of the book CSV files, matching the keys of to_dict()
+    CSV_HEADER: Tuple[str, ...] = ('title', 'author', 'is_loaned', 'copies', 'genre', 'year')
+
     def __init__(self, title: str, author: str, genre: str, year: int, copies: int, loaned_copies: int = 0, total_borrows: int = 0):
         # Validate input arguments
         if not title or not isinstance(title, str):
@@ -70,15 +73,41 @@ class Book(BookInterface):
         if not isinstance(total_borrows, int) or total_borrows < 0:
             raise ValueError("Total borrows must be a non-negative integer")
 
-        # Assign validated fields
-        self._title = title
-        self._author = author
+        # Assign validated fields (the title/author/genre setters also derive the lookup and sort keys)
+        self.title = title
+        self.author = author
         self.genre = genre
         self.year = year
         self.copies = copies
         self.loaned_copies = loaned_copies
+        # Copies not currently loaned out; a plain attribute kept in step by loan/return/update_copies
+        self.available_copies = copies - loaned_copies
         self.total_borrows = total_borrows
 
+    @classmethod
+    def _unchecked(cls, title: str, author: str, genre: str, year: int, copies: int,
+                   loaned_copies: int = 0, total_borrows: int = 0) -> 'Book':
+        """
+        Create a Book from already-typed values without validating them.
+
+        Used for bulk loads whose caller has already checked the values;
+        everything else should go through the validating constructor.
+        """
+        book = object.__new__(cls)
+        book._title = title
+        # Same derived keys as the title/author setters
+        book._title_lower = sys.intern(title.casefold())
+        book._author = sys.intern(author)
+        book._sort_author = author.casefold()
+        book._genre = sys.intern(genre)
+        book._genre_lower = sys.intern(genre.casefold())
+        book.year = year
+        book.copies = copies
+        book.loaned_copies = loaned_copies
+        book.available_copies = copies - loaned_copies
+        book.total_borrows = total_borrows
+        return book
+
     @property
     def title(self) -> str:
         """
@@ -86,6 +115,27 @@ class Book(BookInterface):
         """
         return self._title
 
+    @title.setter
+    def title(self, value: str) -> None:
+        """
+        Set the title of the book and refresh the keys derived from it.
+
+        Raises:
+            ValueError: If value is not a non-empty string.
+        """
+        if not value or not isinstance(value, str):
+            raise ValueError("Title must be a non-empty string")
+        self._title = value
+        # One interned case-folded key serves both case-insensitive lookups and sorting
+        self._title_lower = sys.intern(value.casefold())
+
+    @property
+    def title_lower(self) -> str:
+        """
+        Get the case-folded title used as the case-insensitive lookup key.
+        """
+        return self._title_lower
+
     @property
     def author(self) -> str:
         """
@@ -93,15 +143,40 @@ class Book(BookInterface):
         """
         return self._author
 
+    @author.setter
+    def author(self, value: str) -> None:
+        """
+        Set the author of the book and refresh its sort key.
+
+        Raises:
+            ValueError: If value is not a non-empty string.
+        """
+        if not value or not isinstance(value, str):
+            raise ValueError("Author must be a non-empty string")
+        # Authors repeat across the catalogue, so share one string object per value
+        self._author = sys.intern(value)
+        self._sort_author = value.casefold()
+
     @property
-    def available_copies(self) -> int:
+    def genre(self) -> str:
+        """
+        Get the genre of the book.
         """
-        Get the number of copies available for loan.
+        return self._genre
 
-        Returns:
-            int: The number of copies that are not currently loaned out.
+    @genre.setter
+    def genre(self, value: str) -> None:
         """
-        return self.copies - self.loaned_copies
+        Set the genre of the book and refresh its case-folded search key.
+
+        Raises:
+            ValueError: If value is not a non-empty string.
+        """
+        if not value or not isinstance(value, str):
+            raise ValueError("Genre must be a non-empty string")
+        # Genres repeat across the catalogue, so share one string object per value
+        self._genre = sys.intern(value)
+        self._genre_lower = sys.intern(value.casefold())
 
     @property
     def is_available(self) -> bool:
@@ -121,7 +196,7 @@ class Book(BookInterface):
         Returns:
             bool: True if all copies are loaned out, False otherwise.
         """
-        return self.loaned_copies == self.copies
+        return self.available_copies == 0
 
     @property
     def description(self) -> str:
@@ -133,6 +208,15 @@ class Book(BookInterface):
         """
         return f"{self.title} by {self.author} ({self.year})\nGenre: {self.genre}"
 
+    def description_lines(self) -> List[str]:
+        """
+        Get the description of the book as separate lines.
+
+        Returns:
+            List[str]: A new list holding the lines of `description`.
+        """
+        return [f"{self.title} by {self.author} ({self.year})", f"Genre: {self.genre}"]
+
     @property
     def special_features(self) -> List[str]:
         """
@@ -151,7 +235,8 @@ class Book(BookInterface):
             bool: True if the loan was successful (a copy was available),
                   False if no copies were available.
         """
-        if self.is_available:
+        if self.available_copies > 0:
+            self.available_copies -= 1
             self.loaned_copies += 1
             self.total_borrows += 1
             return True
@@ -167,6 +252,7 @@ class Book(BookInterface):
         """
         if self.loaned_copies > 0:
             self.loaned_copies -= 1
+            self.available_copies += 1
             return True
         return False
 
@@ -186,6 +272,7 @@ class Book(BookInterface):
         if new_count < self.loaned_copies:
             raise ValueError("Cannot reduce total copies below number of loaned copies")
         self.copies = new_count
+        self.available_copies = new_count - self.loaned_copies
 
     def to_dict(self) -> dict:
         """
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Tuple
 from datetime import datetime
 
 
@@ -31,15 +31,39 @@ class BookInterface(ABC):
         """Get list of special features"""
         pass
 
+    @abstractmethod
+    def description_lines(self) -> List[str]:
+        """Get description as a fresh list of lines that the caller may extend"""
+        pass
+
 
 class BookDecorator(BookInterface):
     """
     Base decorator class for enhancing books with additional features.
     Implements the `BookInterface` and wraps an existing book object.
+
+    Subclasses format their own description line and feature in
+    ``_format_text()``; the result is cached in ``_description_suffix`` /
+    ``_feature`` and re-formatted whenever one of the decorator's own
+    attributes is assigned. The wrapped book is still read on every access,
+    so renames and other edits show through. Each decorator appends its line
+    to the list from the book it wraps, and ``description`` joins the
+    finished list once.
     """
+    _description_suffix: Optional[str] = None
+    _feature: Optional[str] = None
+
     def __init__(self, book: BookInterface):
         self._book = book
 
+    def _format_text(self) -> Tuple[Optional[str], Optional[str]]:
+        """Format this decorator's (description line, feature); None adds nothing"""
+        return None, None
+
+    def _refresh_text(self) -> None:
+        """Re-format the cached description line and feature after an attribute changes"""
+        self._description_suffix, self._feature = self._format_text()
+
     @property
     def title(self) -> str:
         return self._book.title
@@ -50,11 +74,20 @@ class BookDecorator(BookInterface):
 
     @property
     def description(self) -> str:
-        return self._book.description
+        # Collect every line of the chain, then join once
+        return "\n".join(self.description_lines())
+
+    def description_lines(self) -> List[str]:
+        lines = self._book.description_lines()
+        if self._description_suffix is not None:
+            lines.append(self._description_suffix)
+        return lines
 
     @property
     def special_features(self) -> List[str]:
-        return self._book.special_features
+        if self._feature is None:
+            return self._book.special_features
+        return self._book.special_features + [self._feature]
 
 
 class DigitalVersionDecorator(BookDecorator):
@@ -63,15 +96,21 @@ class DigitalVersionDecorator(BookDecorator):
     """
     def __init__(self, book: BookInterface, format_types: List[str] = None):
         super().__init__(book)
-        self._formats = format_types or ["PDF", "EPUB"]
+        self.formats = format_types or ["PDF", "EPUB"]
 
     @property
-    def description(self) -> str:
-        return f"{self._book.description}\nAvailable in digital formats: {', '.join(self._formats)}"
+    def formats(self) -> Tuple[str, ...]:
+        return self._formats
 
-    @property
-    def special_features(self) -> List[str]:
-        return self._book.special_features + [f"Digital Version ({', '.join(self._formats)})"]
+    @formats.setter
+    def formats(self, value: Iterable[str]) -> None:
+        # Keep a copy so edits to the caller's list can't bypass the refresh
+        self._formats = tuple(value)
+        self._refresh_text()
+
+    def _format_text(self) -> Tuple[str, str]:
+        formats = ', '.join(self._formats)
+        return f"Available in digital formats: {formats}", f"Digital Version ({formats})"
 
 
 class AudioBookDecorator(BookDecorator):
@@ -80,16 +119,30 @@ class AudioBookDecorator(BookDecorator):
     """
     def __init__(self, book: BookInterface, narrator: str, duration_hours: float):
         super().__init__(book)
-        self.narrator = narrator
+        self._narrator = narrator
         self.duration_hours = duration_hours
 
     @property
-    def description(self) -> str:
-        return f"{self._book.description}\nAudiobook narrated by {self.narrator} ({self.duration_hours} hours)"
+    def narrator(self) -> str:
+        return self._narrator
+
+    @narrator.setter
+    def narrator(self, value: str) -> None:
+        self._narrator = value
+        self._refresh_text()
 
     @property
-    def special_features(self) -> List[str]:
-        return self._book.special_features + [f"Audiobook ({self.duration_hours}h)"]
+    def duration_hours(self) -> float:
+        return self._duration_hours
+
+    @duration_hours.setter
+    def duration_hours(self, value: float) -> None:
+        self._duration_hours = value
+        self._refresh_text()
+
+    def _format_text(self) -> Tuple[str, str]:
+        return (f"Audiobook narrated by {self._narrator} ({self._duration_hours} hours)",
+                f"Audiobook ({self._duration_hours}h)")
 
 
 class AwardWinnerDecorator(BookDecorator):
@@ -98,16 +151,29 @@ class AwardWinnerDecorator(BookDecorator):
     """
     def __init__(self, book: BookInterface, award_name: str, year: int):
         super().__init__(book)
-        self.award_name = award_name
+        self._award_name = award_name
         self.award_year = year
 
     @property
-    def description(self) -> str:
-        return f"{self._book.description}\n{self.award_name} Winner ({self.award_year})"
+    def award_name(self) -> str:
+        return self._award_name
+
+    @award_name.setter
+    def award_name(self, value: str) -> None:
+        self._award_name = value
+        self._refresh_text()
 
     @property
-    def special_features(self) -> List[str]:
-        return self._book.special_features + [f"{self.award_name} ({self.award_year})"]
+    def award_year(self) -> int:
+        return self._award_year
+
+    @award_year.setter
+    def award_year(self, value: int) -> None:
+        self._award_year = value
+        self._refresh_text()
+
+    def _format_text(self) -> Tuple[str, str]:
+        return f"{self._award_name} Winner ({self._award_year})", f"{self._award_name} ({self._award_year})"
 
 
 class BestsellerDecorator(BookDecorator):
@@ -119,12 +185,16 @@ class BestsellerDecorator(BookDecorator):
         self.list_name = list_name
 
     @property
-    def description(self) -> str:
-        return f"{self._book.description}\n{self.list_name} Bestseller"
+    def list_name(self) -> str:
+        return self._list_name
 
-    @property
-    def special_features(self) -> List[str]:
-        return self._book.special_features + [f"{self.list_name} Bestseller"]
+    @list_name.setter
+    def list_name(self, value: str) -> None:
+        self._list_name = value
+        self._refresh_text()
+
+    def _format_text(self) -> Tuple[str, str]:
+        return f"{self._list_name} Bestseller", f"{self._list_name} Bestseller"
 
 
 class AgeRecommendationDecorator(BookDecorator):
@@ -133,24 +203,33 @@ class AgeRecommendationDecorator(BookDecorator):
     """
     def __init__(self, book: BookInterface, min_age: int, max_age: Optional[int] = None):
         super().__init__(book)
-        self.min_age = min_age
+        self._min_age = min_age
         self.max_age = max_age
 
     @property
-    def description(self) -> str:
-        if self.max_age:
-            age_range = f"{self.min_age}-{self.max_age}"
-        else:
-            age_range = f"{self.min_age}+"
-        return f"{self._book.description}\nRecommended Age: {age_range} years"
+    def min_age(self) -> int:
+        return self._min_age
+
+    @min_age.setter
+    def min_age(self, value: int) -> None:
+        self._min_age = value
+        self._refresh_text()
 
     @property
-    def special_features(self) -> List[str]:
-        if self.max_age:
-            age_range = f"{self.min_age}-{self.max_age}"
+    def max_age(self) -> Optional[int]:
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value: Optional[int]) -> None:
+        self._max_age = value
+        self._refresh_text()
+
+    def _format_text(self) -> Tuple[str, str]:
+        if self._max_age:
+            age_range = f"{self._min_age}-{self._max_age}"
         else:
-            age_range = f"{self.min_age}+"
-        return self._book.special_features + [f"Age Range: {age_range}"]
+            age_range = f"{self._min_age}+"
+        return f"Recommended Age: {age_range} years", f"Age Range: {age_range}"
 
 
 # Example usage:
@@ -1,4 +1,6 @@
 import csv
+import os
+from contextlib import suppress
 from typing import List, Optional
 from .book import Book
 
@@ -60,13 +62,42 @@ class BookFactory:
         books = []
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+            with open(filepath, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    return books
+
+                # Resolve column positions once instead of building a dict per row
+                missing = [name for name in Book.CSV_HEADER if name not in header]
+                if missing:
+                    raise ValueError(f"CSV file is missing columns: {', '.join(missing)}")
+                title_i, author_i, loaned_i, copies_i, genre_i, year_i = map(header.index, Book.CSV_HEADER)
+
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        book = Book.from_dict(row)
-                        books.append(book)
-                    except (ValueError, KeyError) as e:
+                        title, author, genre = row[title_i], row[author_i], row[genre_i]
+                        copies = int(row[copies_i])
+                        year = int(row[year_i])
+                        # The files may be edited by hand, so keep the constructor's value checks;
+                        # csv and int() already guarantee the types it would check
+                        if not title or not author or not genre:
+                            raise ValueError("Title, author and genre must be non-empty")
+                        if copies < 0:
+                            raise ValueError("Number of copies must be a non-negative integer")
+                        # If the book is marked as loaned in the CSV, we assume all copies are loaned
+                        loaned_copies = copies if row[loaned_i].lower() == 'yes' else 0
+                        books.append(Book._unchecked(
+                            title=title,
+                            author=author,
+                            copies=copies,
+                            genre=genre,
+                            year=year,
+                            loaned_copies=loaned_copies
+                        ))
+                    except (ValueError, IndexError) as e:
                         # Log the error but continue processing other books
                         print(f"Error creating book from row {row}: {str(e)}")
                         continue
@@ -90,17 +121,26 @@ class BookFactory:
         Raises:
             IOError: If there's an error writing to the file.
         """
+        # Write a temporary file and swap it in, so a crash never leaves a truncated file
+        tmp_path = filepath + '.tmp'
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as file:
-                if not books:
-                    writer = csv.writer(file)
-                    writer.writerow(['title', 'author', 'is_loaned', 'copies', 'genre', 'year'])
-                    return
-
-                writer = csv.DictWriter(file, fieldnames=books[0].to_dict().keys())
-                writer.writeheader()
-                for book in books:
-                    writer.writerow(book.to_dict())
-
-        except IOError as e:
-            raise IOError(f"Error writing to CSV file: {str(e)}")
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(Book.CSV_HEADER)
+                # Same columns as Book.to_dict(), written as plain tuples
+                writer.writerows(
+                    (book.title, book.author, 'Yes' if book.is_fully_loaned else 'No',
+                     book.copies, book.genre, book.year)
+                    for book in books
+                )
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, filepath)
+
+        except BaseException as e:
+            # Never leave the temporary file behind, whatever interrupted the write
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            if isinstance(e, IOError):
+                raise IOError(f"Error writing to CSV file: {str(e)}")
+            raise
@@ -1,140 +1,120 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Iterator
-from collections import defaultdict
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from itertools import groupby, filterfalse
+from operator import attrgetter
+import heapq
 
 
 class BookIterator(ABC):
     """Abstract base class for book iterators"""
 
-    @abstractmethod
-    def __iter__(self) -> Iterator:
-        pass
+    __slots__ = ()
 
     @abstractmethod
-    def __next__(self) -> 'Book':
+    def __iter__(self) -> Iterator:
         pass
 
 
 class ChronologicalIterator(BookIterator):
-    """Iterates through books in chronological order"""
+    """Iterates through books in chronological order, optionally only the first `limit` books"""
 
-    def __init__(self, books: List['Book'], reverse: bool = False):
-        self._books = sorted(books, key=lambda x: x.year, reverse=reverse)
-        self._index = 0
+    __slots__ = ('_books',)
 
-    def __iter__(self) -> Iterator:
-        return self
+    def __init__(self, books: Iterable['Book'], reverse: bool = False, limit: Optional[int] = None):
+        key = attrgetter('year')
+        if limit is None:
+            self._books = sorted(books, key=key, reverse=reverse)
+        elif reverse:
+            self._books = heapq.nlargest(limit, books, key=key)
+        else:
+            self._books = heapq.nsmallest(limit, books, key=key)
 
-    def __next__(self) -> 'Book':
-        if self._index >= len(self._books):
-            raise StopIteration
-        book = self._books[self._index]
-        self._index += 1
-        return book
+    def __iter__(self) -> Iterator:
+        return iter(self._books)
 
 
 class AlphabeticalIterator(BookIterator):
-    """Iterates through books in alphabetical order"""
+    """Iterates through books in case-insensitive alphabetical order"""
 
-    def __init__(self, books: List['Book'], by_author: bool = False):
-        self._books = sorted(books, key=lambda x: x.author if by_author else x.title)
-        self._index = 0
+    __slots__ = ('_books',)
 
-    def __iter__(self) -> Iterator:
-        return self
+    def __init__(self, books: Iterable['Book'], by_author: bool = False):
+        key = attrgetter('_sort_author' if by_author else '_title_lower')
+        self._books = sorted(books, key=key)
 
-    def __next__(self) -> 'Book':
-        if self._index >= len(self._books):
-            raise StopIteration
-        book = self._books[self._index]
-        self._index += 1
-        return book
+    def __iter__(self) -> Iterator:
+        return iter(self._books)
 
 
 class GenreIterator(BookIterator):
     """Iterates through books grouped by genre"""
 
-    def __init__(self, books: List['Book']):
-        # Group books by genre
-        self._genre_books: Dict[str, List['Book']] = defaultdict(list)
-        for book in books:
-            self._genre_books[book.genre].append(book)
-
-        # Sort genres and books within each genre
-        self._genres = sorted(self._genre_books.keys())
-        for genre in self._genres:
-            self._genre_books[genre].sort(key=lambda x: x.title)
-
-        self._genre_index = 0
-        self._book_index = 0
+    __slots__ = ('_genre_books', '_genres', '_current_genre')
+
+    def __init__(self, books: Iterable['Book'], genre_books: Optional[Dict[str, List['Book']]] = None):
+        """
+        Args:
+            books: Books to group when no pre-built grouping is given.
+            genre_books: Optional genre -> books mapping whose lists are already
+                sorted by title (as maintained by LibrarySystem). The lists are
+                copied, so later changes to the mapping don't reach the iterator.
+        """
+        if genre_books is None:
+            # Sort once by (genre, title), then split the sorted run into genre groups
+            ordered = sorted(books, key=attrgetter('genre', '_title_lower'))
+            grouped = groupby(ordered, key=attrgetter('genre'))
+        else:
+            grouped = genre_books.items()
+        self._genre_books: Dict[str, Tuple['Book', ...]] = {genre: tuple(group) for genre, group in grouped}
+        self._genres = sorted(self._genre_books)
+
+        self._current_genre = self._genres[0] if self._genres else None
 
     def __iter__(self) -> Iterator:
-        return self
-
-    def __next__(self) -> 'Book':
-        if self._genre_index >= len(self._genres):
-            raise StopIteration
-
-        current_genre = self._genres[self._genre_index]
-        current_genre_books = self._genre_books[current_genre]
-
-        if self._book_index >= len(current_genre_books):
-            self._genre_index += 1
-            self._book_index = 0
-            return self.__next__()
-
-        book = current_genre_books[self._book_index]
-        self._book_index += 1
-        return book
+        for genre in self._genres:
+            self._current_genre = genre
+            yield from self._genre_books[genre]
+        self._current_genre = None
 
     def current_genre(self) -> str:
         """Get the current genre being iterated"""
-        if self._genre_index >= len(self._genres):
-            return None
-        return self._genres[self._genre_index]
+        return self._current_genre
 
 
 class PopularityIterator(BookIterator):
-    """Iterates through books based on their popularity (waiting list size)"""
+    """Iterates through books based on their popularity (waiting list size), optionally only the top `limit`"""
 
-    def __init__(self, books: List['Book'], library_system: 'LibrarySystem'):
-        self._books = sorted(
-            books,
-            key=lambda x: len(library_system.get_waiting_list(x.title)),
-            reverse=True
-        )
-        self._index = 0
+    __slots__ = ('_books',)
 
-    def __iter__(self) -> Iterator:
-        return self
+    def __init__(self, books: Iterable['Book'], library_system: 'LibrarySystem', limit: Optional[int] = None):
+        # Fetch all waiting-list sizes in one call, then sort positions by the precomputed counts
+        books = list(books)
+        sizes = library_system.get_waiting_list_sizes()
+        counts = [sizes.get(book.title, 0) for book in books]
+        if limit is None:
+            order = sorted(range(len(books)), key=counts.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(limit, range(len(books)), key=counts.__getitem__)
+        self._books = [books[i] for i in order]
 
-    def __next__(self) -> 'Book':
-        if self._index >= len(self._books):
-            raise StopIteration
-        book = self._books[self._index]
-        self._index += 1
-        return book
+    def __iter__(self) -> Iterator:
+        return iter(self._books)
 
 
 class AvailabilityIterator(BookIterator):
     """Iterates through books based on their availability"""
 
-    def __init__(self, books: List['Book'], available_only: bool = True):
-        self._books = sorted(
-            [b for b in books if b.is_available == available_only],
-            key=lambda x: x.title
-        )
-        self._index = 0
+    __slots__ = ('_books',)
+
+    def __init__(self, books: Iterable['Book'], available_only: bool = True):
+        # Filter on the availability flag directly, then sort the fresh list in place
+        is_available = attrgetter('is_available')
+        selected = filter(is_available, books) if available_only else filterfalse(is_available, books)
+        self._books = list(selected)
+        self._books.sort(key=attrgetter('_title_lower'))
 
     def __iter__(self) -> Iterator:
-        return self
-
-    def __next__(self) -> 'Book':
-        if self._index >= len(self._books):
-            raise StopIteration
-        book = self._books[self._index]
-        self._index += 1
-        return book
+        return iter(self._books)
 
 
 # Add this method to LibrarySystem class:
@@ -1,22 +1,111 @@
+import logging
 import tkinter as tk
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
 from tkinter import ttk, messagebox
-from typing import Optional
 from .library_system import LibrarySystem
 from .user_management import UserManager
 from .notification import UserNotificationObserver
-from .book_iterator import GenreIterator
+from .book_iterator import BookIterator, GenreIterator
 from .book import Book
 
+logger = logging.getLogger(__name__)
+
+
+# Rows inserted into a Treeview at a time; more are added as the view scrolls near the end
+_TREE_PAGE_SIZE = 100
+# Fraction of the loaded rows scrolled past before the next page is inserted
+_TREE_PREFETCH_AT = 0.9
+# Tcl helper that inserts a whole list of rows in one call from Python
+_BULK_INSERT_PROC = '::lms_bulk_insert'
+_BULK_INSERT_SCRIPT = ('proc %s {tree rows {ids {}}} {'
+                       'if {[llength $ids]} {foreach id $ids row $rows {$tree insert {} end -id $id -values $row}} '
+                       'else {foreach row $rows {$tree insert {} end -values $row}}}'
+                       % _BULK_INSERT_PROC)
+# Idle time after the last keystroke before the search dialog runs a search
+_SEARCH_DEBOUNCE_MS = 150
+# How often the Tk thread checks whether a worker-thread query has finished
+_FUTURE_POLL_MS = 15
+# Availability cell text, indexed by Book.is_available
+_YESNO = ("No", "Yes")
+_AVAILABILITY_STATUS = ("Unavailable", "Available")
+# Delay before the book features preview redraws after a selection change
+_PREVIEW_DEBOUNCE_MS = 50
+# Notification timestamps are shown as "YYYY-MM-DD HH:MM"
+_TIMESTAMP_SPEC = 'minutes'
+
+# Colors
+_PRIMARY_COLOR = "#2c3e50"  # Dark blue-gray
+_SECONDARY_COLOR = "#3498db"  # Bright blue
+_ACCENT_COLOR = "#e74c3c"  # Red for important actions
+_BG_COLOR = "#ecf0f1"  # Light gray
+_TEXT_COLOR = "#2c3e50"  # Dark blue-gray
+
+# Fonts
+_FONT_BASE = ('Helvetica', 10)
+_FONT_BOLD = ('Helvetica', 10, 'bold')
+
+# ttk style name -> options passed to Style.configure
+_STYLES = {
+    # Common elements
+    '.': {'background': _BG_COLOR, 'foreground': _TEXT_COLOR, 'font': _FONT_BASE},
+    # Main buttons
+    'Main.TButton': {'font': ('Helvetica', 11), 'padding': 10, 'background': _SECONDARY_COLOR,
+                     'relief': 'raised'},
+    # Action buttons (like Submit, Save, etc.)
+    'Action.TButton': {'font': _FONT_BOLD, 'padding': 8, 'background': _ACCENT_COLOR},
+    # Labels
+    'Title.TLabel': {'font': ('Helvetica', 16, 'bold'), 'foreground': _PRIMARY_COLOR, 'padding': 10},
+    'Subtitle.TLabel': {'font': ('Helvetica', 12), 'foreground': _PRIMARY_COLOR, 'padding': 5},
+    # Frames
+    'Main.TFrame': {'background': _BG_COLOR, 'relief': 'flat'},
+    # Notebook (tabbed interface)
+    'TNotebook': {'background': _BG_COLOR, 'tabmargins': [2, 5, 2, 0]},
+    'TNotebook.Tab': {'padding': [10, 5], 'font': _FONT_BASE},
+    # Treeview (for lists)
+    'Treeview': {'font': _FONT_BASE, 'rowheight': 25},
+    'Treeview.Heading': {'font': _FONT_BOLD, 'background': _SECONDARY_COLOR, 'foreground': 'white'},
+    # Entry fields
+    'TEntry': {'padding': 5, 'selectbackground': _SECONDARY_COLOR},
+}
+
+# ttk style name -> state-dependent options passed to Style.map
+_STYLE_MAPS = {
+    'Main.TButton': {'background': [('active', '#2980b9'), ('pressed', '#2980b9')],
+                     'relief': [('pressed', 'sunken')]},
+}
+
 
 class LibraryGUI:
+    # Main menu sections: (frame label, ((button text, handler method name), ...))
+    _MENU_SECTIONS = (
+        ("Book Management", (
+            ("Add Book", '_show_add_book_dialog'),
+            ("Remove Book", '_show_remove_book_dialog'),
+            ("Edit Book", '_show_edit_book_dialog'),
+            ("Book Features", '_show_book_features_dialog'),
+        )),
+        ("User Actions", (
+            ("Lend Book", '_show_lend_dialog'),
+            ("Return Book", '_show_return_dialog'),
+            ("Waiting Lists", '_show_waiting_list_dialog'),
+            ("Notifications", '_show_notifications'),
+        )),
+        ("Features & Navigation", (
+            ("Search Book", '_show_search_dialog'),
+            ("View Book", '_show_view_books'),
+            ("Browse Books", '_show_book_navigation_dialog'),
+            ("Popular Books", '_show_popular_books'),
+        )),
+    )
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Library Management System")
         self.root.geometry("800x600")
 
         # Configure window
-        self.root.configure(bg="#ecf0f1")  # Set background color
+        self.root.configure(bg=_BG_COLOR)  # Set background color
 
         # Configure styles
         self.style = self._configure_styles()
@@ -25,9 +114,17 @@ class LibraryGUI:
         self.library = LibrarySystem()
         self.user_manager = UserManager()
 
+        # Runs read-only library queries off the Tk thread; results are posted back with after()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='library-query')
+
         # Track current user
         self.current_user: Optional[str] = None
 
+        # Notifications window, built on first use and hidden rather than destroyed on close
+        self._notifications_dialog: Optional[tk.Toplevel] = None
+        self._notifications_tree: Optional[ttk.Treeview] = None
+        self._notifications_empty_label: Optional[ttk.Label] = None
+
         # Create main frame with styling
         self.main_frame = ttk.Frame(self.root, padding="20", style='Main.TFrame')
         self.main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -39,10 +136,54 @@ class LibraryGUI:
         # Start with login screen
         self.show_login_screen()
 
+    def _make_dialog(self, title: str, geometry: Optional[str] = None) -> tk.Toplevel:
+        """
+        Create a dialog window owned by the main window.
+
+        Closing the dialog from the window manager destroys it, which also
+        releases its child widgets and the Tcl commands behind their callbacks.
+
+        Args:
+            title: Window title.
+            geometry: Optional Tk geometry string such as "400x300".
+
+        Returns:
+            tk.Toplevel: The new dialog.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        if geometry:
+            dialog.geometry(geometry)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.destroy)
+        return dialog
+
     def _clear_frame(self):
         """Clear all widgets from the main frame"""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        children = list(self.main_frame.children.values())
+        if not children:
+            return
+
+        # Tear the whole subtree down in one Tcl call, then drop the Python side
+        self.main_frame.tk.call('destroy', *[child._w for child in children])
+        for child in children:
+            self._release_widget(child)
+        self.main_frame.children.clear()
+
+    @staticmethod
+    def _release_widget(widget: tk.Misc):
+        """
+        Release the Python-side state of a widget that Tcl already destroyed.
+
+        Drops the widget's children and deletes the Tcl commands registered for
+        its callbacks, which tkinter's destroy() would otherwise have done.
+
+        Args:
+            widget: Widget whose Tk window no longer exists.
+        """
+        for child in list(widget.children.values()):
+            LibraryGUI._release_widget(child)
+        widget.children.clear()
+        tk.Misc.destroy(widget)
 
     def _configure_styles(self):
         """Configure ttk styles for the application"""
@@ -52,84 +193,10 @@ class LibraryGUI:
         # Set theme
         style.theme_use('clam')  # 'clam' is a good base theme for customization
 
-        # Define colors
-        primary_color = "#2c3e50"  # Dark blue-gray
-        secondary_color = "#3498db"  # Bright blue
-        accent_color = "#e74c3c"  # Red for important actions
-        bg_color = "#ecf0f1"  # Light gray
-        text_color = "#2c3e50"  # Dark blue-gray
-
-        # Configure common elements
-        style.configure('.',  # Default style
-                        background=bg_color,
-                        foreground=text_color,
-                        font=('Helvetica', 10)
-                        )
-
-        # Main buttons style
-        style.configure('Main.TButton',
-                        font=('Helvetica', 11),
-                        padding=10,
-                        background=secondary_color,
-                        relief='raised'
-                        )
-        style.map('Main.TButton',
-                  background=[('active', '#2980b9'), ('pressed', '#2980b9')],
-                  relief=[('pressed', 'sunken')]
-                  )
-
-        # Action buttons (like Submit, Save, etc.)
-        style.configure('Action.TButton',
-                        font=('Helvetica', 10, 'bold'),
-                        padding=8,
-                        background=accent_color
-                        )
-
-        # Labels
-        style.configure('Title.TLabel',
-                        font=('Helvetica', 16, 'bold'),
-                        foreground=primary_color,
-                        padding=10
-                        )
-
-        style.configure('Subtitle.TLabel',
-                        font=('Helvetica', 12),
-                        foreground=primary_color,
-                        padding=5
-                        )
-
-        # Frames
-        style.configure('Main.TFrame',
-                        background=bg_color,
-                        relief='flat'
-                        )
-
-        # Notebook (tabbed interface)
-        style.configure('TNotebook',
-                        background=bg_color,
-                        tabmargins=[2, 5, 2, 0]
-                        )
-        style.configure('TNotebook.Tab',
-                        padding=[10, 5],
-                        font=('Helvetica', 10)
-                        )
-
-        # Treeview (for lists)
-        style.configure('Treeview',
-                        font=('Helvetica', 10),
-                        rowheight=25
-                        )
-        style.configure('Treeview.Heading',
-                        font=('Helvetica', 10, 'bold'),
-                        background=secondary_color,
-                        foreground='white'
-                        )
-
-        # Entry fields
-        style.configure('TEntry',
-                        padding=5,
-                        selectbackground=secondary_color
-                        )
+        for name, options in _STYLES.items():
+            style.configure(name, **options)
+        for name, options in _STYLE_MAPS.items():
+            style.map(name, **options)
 
         # Return style object for further customization if needed
         return style
@@ -197,55 +264,16 @@ class LibraryGUI:
             style='Title.TLabel'
         ).pack(pady=10)
 
-        # Create frames for different button categories
-        book_management_frame = ttk.LabelFrame(self.main_frame, text="Book Management", style='Main.TFrame', padding=10)
-        book_management_frame.grid(row=1, column=0, padx=10, pady=5, sticky='nsew')
+        # One labelled column of buttons per menu section
+        for column, (section, buttons) in enumerate(self._MENU_SECTIONS):
+            frame = ttk.LabelFrame(self.main_frame, text=section, style='Main.TFrame', padding=10)
+            frame.grid(row=1, column=column, padx=10, pady=5, sticky='nsew')
+            self.main_frame.grid_columnconfigure(column, weight=1)
 
-        user_actions_frame = ttk.LabelFrame(self.main_frame, text="User Actions", style='Main.TFrame', padding=10)
-        user_actions_frame.grid(row=1, column=1, padx=10, pady=5, sticky='nsew')
-
-        features_frame = ttk.LabelFrame(self.main_frame, text="Features & Navigation", style='Main.TFrame', padding=10)
-        features_frame.grid(row=1, column=2, padx=10, pady=5, sticky='nsew')
-
-        # Configure grid weights for frames
-        self.main_frame.grid_columnconfigure(0, weight=1)
-        self.main_frame.grid_columnconfigure(1, weight=1)
-        self.main_frame.grid_columnconfigure(2, weight=1)
-
-        # Book Management buttons
-        book_management_buttons = [
-            ("Add Book", self._show_add_book_dialog),
-            ("Remove Book", self._show_remove_book_dialog),
-            ("Edit Book", self._show_edit_book_dialog),
-            ("Book Features", self._show_book_features_dialog),
-        ]
-
-        # User Actions buttons
-        user_actions_buttons = [
-            ("Lend Book", self._show_lend_dialog),
-            ("Return Book", self._show_return_dialog),
-            ("Waiting Lists", self._show_waiting_list_dialog),
-            ("Notifications", self._show_notifications),
-        ]
-
-        # Features & Navigation buttons
-        features_buttons = [
-            ("Search Book", self._show_search_dialog),
-            ("View Book", self._show_view_books),
-            ("Browse Books", self._show_book_navigation_dialog),
-            ("Popular Books", self._show_popular_books),
-        ]
-
-        # Helper function to create buttons in a frame
-        def create_buttons(frame, buttons):
-            for i, (text, command) in enumerate(buttons):
-                btn = ttk.Button(frame, text=text, command=command, style='Main.TButton')
-                btn.pack(fill='x', pady=5, padx=5)
-
-        # Create all buttons
-        create_buttons(book_management_frame, book_management_buttons)
-        create_buttons(user_actions_frame, user_actions_buttons)
-        create_buttons(features_frame, features_buttons)
+            for text, method_name in buttons:
+                ttk.Button(
+                    frame, text=text, command=getattr(self, method_name), style='Main.TButton'
+                ).pack(fill='x', pady=5, padx=5)
 
         # Logout button at the bottom
         logout_frame = ttk.Frame(self.main_frame, style='Main.TFrame')
@@ -259,9 +287,7 @@ class LibraryGUI:
 
     def _show_login_dialog(self):
         """Show login dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Login")
-        dialog.geometry("300x200")
+        dialog = self._make_dialog("Login", "300x200")
 
         # Create a frame for the login form with padding
         form_frame = ttk.Frame(dialog, padding="20")
@@ -284,22 +310,22 @@ class LibraryGUI:
                 username = username_var.get()
                 password = password_var.get()
 
-                print(f"Attempting login for user: {username}")
+                logger.debug("Attempting login for user: %s", username)
 
                 if self.user_manager.authenticate(username, password):
-                    print("Authentication successful")
+                    logger.debug("Authentication successful")
                     self.current_user = username
-                    print(f"Registering {username} for notifications")
+                    logger.debug("Registering %s for notifications", username)
                     self.library.register_user_for_notifications(username)
                     dialog.destroy()
                     self.show_main_menu()
                     self.library._log_operation("logged in successfully")
                 else:
-                    print("Authentication failed")
+                    logger.debug("Authentication failed")
                     self.library._log_operation("login failed", is_error=True)
                     messagebox.showerror("Error", "Invalid credentials")
             except Exception as e:
-                print(f"Login error: {str(e)}")
+                logger.error("Login error: %s", e)
                 messagebox.showerror("Error", f"Login error: {str(e)}")
 
         # Login button
@@ -312,52 +338,39 @@ class LibraryGUI:
         # Focus username field
         username_entry.focus()
 
-        # Login button - Make sure this is properly placed
-        login_button = ttk.Button(form_frame, text="Login", command=try_login)
-        login_button.grid(row=2, column=0, columnspan=2, pady=20)
+    def _show_notifications(self):
+        """Show user notifications, reusing the notifications window once it exists"""
+        logger.debug("Checking notifications for %s", self.current_user)
+        logger.debug("Number of observers: %d", self.library.notification_center.observer_count)
 
-        # Bind Enter key to log in
-        dialog.bind('<Return>', lambda e: try_login())
+        dialog = self._notifications_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_notifications_dialog()
 
-        # Focus username field
-        username_entry.focus()
+        self._refresh_notifications()
+        dialog.deiconify()
+        dialog.lift()
 
-    def _show_notifications(self):
-        """Show user notifications"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Notifications")
-        dialog.geometry("400x300")
+    def _build_notifications_dialog(self) -> tk.Toplevel:
+        """
+        Create the notifications window; closing it only hides it.
 
-        print(f"Checking notifications for {self.current_user}")
-        print(f"Number of observers: {len(self.library.notification_center._observers)}")
+        Returns:
+            tk.Toplevel: The new notifications window.
+        """
+        dialog = self._make_dialog("Notifications", "400x300")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
 
         # Create treeview for notifications
-        tree = ttk.Treeview(dialog, columns=("Time", "Message"))
+        tree = ttk.Treeview(dialog, columns=("Time", "Message"), show='headings')
         tree.heading("Time", text="Time")
         tree.heading("Message", text="Message")
-        tree.column("#0", width=0, stretch=tk.NO)
-
-        # Get all notifications for current user
-        user_notifications = self.library.notification_center.get_user_notifications(self.current_user)
-        print(f"Found {len(user_notifications)} notifications for {self.current_user}")
-
-        if user_notifications:
-            for notification in user_notifications:
-                tree.insert("", "end", values=(
-                    notification.timestamp.strftime("%Y-%m-%d %H:%M"),
-                    notification.message
-                ))
-        else:
-            ttk.Label(dialog, text="No notifications").pack(pady=20)
-
         tree.pack(fill='both', expand=True)
 
         # Clear button
         def clear_notifications():
             self.library.notification_center.clear_user_notifications(self.current_user)
-            for item in tree.get_children():
-                tree.delete(item)
-            ttk.Label(dialog, text="No notifications").pack(pady=20)
+            self._refresh_notifications()
 
         ttk.Button(
             dialog,
@@ -365,11 +378,33 @@ class LibraryGUI:
             command=clear_notifications
         ).pack(pady=10)
 
+        self._notifications_dialog = dialog
+        self._notifications_tree = tree
+        # Shown above the tree only while the list is empty
+        self._notifications_empty_label = ttk.Label(dialog, text="No notifications")
+        return dialog
+
+    def _refresh_notifications(self):
+        """Refill the notifications window with the current user's notifications"""
+        tree = self._notifications_tree
+        tree.delete(*tree.get_children())
+
+        # Get all notifications for current user
+        user_notifications = self.library.notification_center.get_user_notifications(self.current_user)
+        logger.debug("Found %d notifications for %s", len(user_notifications), self.current_user)
+
+        if user_notifications:
+            self._notifications_empty_label.pack_forget()
+            self._bulk_insert(tree, [
+                (notification.timestamp.isoformat(' ', _TIMESTAMP_SPEC), notification.message)
+                for notification in user_notifications
+            ])
+        else:
+            self._notifications_empty_label.pack(before=tree, pady=20)
+
     def _show_register_dialog(self):
         """Show registration dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Register")
-        dialog.geometry("300x150")
+        dialog = self._make_dialog("Register", "300x150")
 
         ttk.Label(dialog, text="Username:").grid(row=0, column=0, pady=5, padx=5)
         username_var = tk.StringVar()
@@ -397,9 +432,7 @@ class LibraryGUI:
 
     def _show_add_book_dialog(self):
         """Show dialog for adding a book"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Add Book")
-        dialog.geometry("400x300")
+        dialog = self._make_dialog("Add Book", "400x300")
 
         # Create entry fields for book details
         fields = {}
@@ -434,8 +467,7 @@ class LibraryGUI:
 
     def _show_remove_book_dialog(self):
         """Show dialog for removing a book from the library with consistent styling"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Remove Book")
+        dialog = self._make_dialog("Remove Book")
 
         # Center the dialog on the screen
         dialog_width = 400
@@ -483,9 +515,7 @@ class LibraryGUI:
     def _show_popular_books(self):
         """Show popular books based on waiting lists and borrow history"""
         try:
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Popular Books")
-            dialog.geometry("800x500")
+            dialog = self._make_dialog("Popular Books", "800x500")
 
             # Create notebook for different popularity metrics
             notebook = ttk.Notebook(dialog)
@@ -499,12 +529,11 @@ class LibraryGUI:
 
             # Function to create trees
             def create_tree(parent, extra_column):
-                tree = ttk.Treeview(parent, columns=("Title", "Author", "Genre", extra_column))
+                tree = ttk.Treeview(parent, columns=("Title", "Author", "Genre", extra_column), show='headings')
                 tree.heading("Title", text="Title")
                 tree.heading("Author", text="Author")
                 tree.heading("Genre", text="Genre")
                 tree.heading(extra_column, text=extra_column)
-                tree.column("#0", width=0, stretch=tk.NO)
 
                 # Add scrollbar
                 scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
@@ -512,37 +541,22 @@ class LibraryGUI:
 
                 tree.pack(side="left", fill="both", expand=True)
                 scrollbar.pack(side="right", fill="y")
-                return tree
+                return tree, scrollbar
 
             # Create and populate "Most Wanted" tree
-            waiting_tree = create_tree(waiting_frame, "Waiting List")
-            waiting_books = [(book, len(self.library.get_waiting_list(book.title)))
-                             for book in self.library.get_all_books()]
-            waiting_books.sort(key=lambda x: x[1], reverse=True)  # Sort by waiting list size
-
-            for book, waiting_count in waiting_books:
-                if waiting_count > 0:  # Only show books with people waiting
-                    waiting_tree.insert("", "end", values=(
-                        book.title,
-                        book.author,
-                        book.genre,
-                        waiting_count
-                    ))
-
-            borrowed_tree = create_tree(borrowed_frame, "Times Borrowed")
-            borrowed_books = [(book, book.total_borrows)
-                              for book in self.library.get_all_books()]
-            borrowed_books.sort(key=lambda x: x[1], reverse=True)  # Sort by borrow count
-
-            # Show top 10 most borrowed books or all if less than 10
-            for book, borrow_count in borrowed_books[:10]:
-                if borrow_count > 0:  # Only show books that have been borrowed
-                    borrowed_tree.insert("", "end", values=(
-                        book.title,
-                        book.author,
-                        book.genre,
-                        borrow_count
-                    ))
+            waiting_tree, waiting_scrollbar = create_tree(waiting_frame, "Waiting List")
+            # Only books with people waiting, sorted by waiting list size
+            self._insert_rows_lazily(waiting_tree, waiting_scrollbar, [
+                (book.title, book.author, book.genre, waiting_count)
+                for book, waiting_count in self.library.get_most_wanted_books()
+            ])
+
+            borrowed_tree, _ = create_tree(borrowed_frame, "Times Borrowed")
+            # Show top 10 most borrowed books (only books that have been borrowed)
+            self._bulk_insert(borrowed_tree, [
+                (book.title, book.author, book.genre, book.total_borrows)
+                for book in self.library.get_most_borrowed_books(10)
+            ])
 
             self.library._log_operation("Displayed popular books successfully")
         except Exception as e:
@@ -551,58 +565,90 @@ class LibraryGUI:
 
     def run(self):
         """Start the GUI application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
     def _show_search_dialog(self):
         """Show dialog for searching books"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Search Books")
-        dialog.geometry("400x500")
+        dialog = self._make_dialog("Search Books", "400x500")
 
         # Search criteria
         ttk.Label(dialog, text="Search by:").grid(row=0, column=0, pady=5, padx=5)
         strategy_var = tk.StringVar(value="title")
         strategies = ["title", "author", "genre", "year"]
-        strategy_menu = ttk.OptionMenu(dialog, strategy_var, "title", *strategies)
+        strategy_menu = ttk.Combobox(dialog, textvariable=strategy_var, values=strategies, state='readonly')
         strategy_menu.grid(row=0, column=1, pady=5, padx=5)
 
         ttk.Label(dialog, text="Search query:").grid(row=1, column=0, pady=5, padx=5)
         query_var = tk.StringVar()
-        ttk.Entry(dialog, textvariable=query_var).grid(row=1, column=1, pady=5, padx=5)
+        query_entry = ttk.Entry(dialog, textvariable=query_var)
+        query_entry.grid(row=1, column=1, pady=5, padx=5)
 
         # Results list
         results_frame = ttk.Frame(dialog)
         results_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=10)
 
-        results_list = ttk.Treeview(results_frame, columns=("Title", "Author", "Genre", "Available"))
+        results_list = ttk.Treeview(results_frame, columns=("Title", "Author", "Genre", "Available"), show='headings')
         results_list.heading("Title", text="Title")
         results_list.heading("Author", text="Author")
         results_list.heading("Genre", text="Genre")
         results_list.heading("Available", text="Available")
         results_list.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        pending_search = None
+
+        def cancel_pending_search(event=None):
+            nonlocal pending_search
+            if pending_search is not None:
+                dialog.after_cancel(pending_search)
+                pending_search = None
+
+        search_generation = 0
+
         def perform_search():
+            nonlocal search_generation
+            cancel_pending_search()
+            search_generation += 1
+            generation = search_generation
+            # Snapshot the books here on the Tk thread; the search itself runs on the worker
+            # thread and only the results are handed back to Tk
+            future = self._executor.submit(self.library.prepare_search(strategy_var.get(), query_var.get()))
+            self._when_done(future, lambda done: show_results(generation, done))
+
+        def show_results(generation: int, future: Future):
+            # Drop results of searches superseded while they ran, or that finished after the dialog closed
+            if generation != search_generation or not results_list.winfo_exists():
+                return
             results_list.delete(*results_list.get_children())
             try:
-                books = self.library.search_books(strategy_var.get(), query_var.get())
-                for book in books:
-                    results_list.insert("", "end", values=(
-                        book.title,
-                        book.author,
-                        book.genre,
-                        "Yes" if book.is_available else "No"
-                    ))
+                books = future.result()
             except Exception as e:
                 messagebox.showerror("Error", str(e))
+                return
+            self._bulk_insert(results_list, [
+                (book.title, book.author, book.genre, _YESNO[book.is_available])
+                for book in books
+            ])
+
+        def schedule_search(event=None):
+            # Restart the timer on every change so a burst of typing runs a single search
+            nonlocal pending_search
+            cancel_pending_search()
+            pending_search = dialog.after(_SEARCH_DEBOUNCE_MS, perform_search)
+
+        query_entry.bind('<KeyRelease>', schedule_search)
+        strategy_menu.bind('<<ComboboxSelected>>', schedule_search)
+        # Closing the dialog mid-typing must not leave a timer pointing at destroyed widgets
+        query_entry.bind('<Destroy>', cancel_pending_search)
 
         ttk.Button(dialog, text="Search", command=perform_search).grid(row=3, column=0, columnspan=2, pady=10)
 
     def _show_view_books(self):
         """Show all books in the library"""
         try:
-            dialog = tk.Toplevel(self.root)
-            dialog.title("View Books")
-            dialog.geometry("600x400")
+            dialog = self._make_dialog("View Books", "600x400")
 
             # Create notebook for different views
             notebook = ttk.Notebook(dialog)
@@ -619,9 +665,12 @@ class LibraryGUI:
             notebook.add(borrowed_frame, text="Borrowed Books")
             notebook.add(category_frame, text="By Category")
 
+            # Snapshot the collection once; every tab of this dialog reads from it
+            all_books = self.library.get_all_books()
+
             # Populate all books
             try:
-                self._populate_book_list(all_frame, self.library.get_all_books())
+                self._populate_book_list(all_frame, all_books)
                 self.library._log_operation("Displayed all books successfully")
             except Exception as e:
                 self.library._log_operation("Failed to display all books", is_error=True)
@@ -645,16 +694,17 @@ class LibraryGUI:
 
             # Add category selection
             try:
-                categories = sorted(set(book.genre for book in self.library.get_all_books()))
+                categories = sorted(self.library.books_by_genre)
                 category_var = tk.StringVar()
                 category_selector = ttk.Combobox(category_frame, textvariable=category_var, values=categories)
                 category_selector.pack(pady=5)
 
                 def show_category():
                     category = category_var.get()
-                    books = [book for book in self.library.get_all_books() if book.genre == category]
+                    # The library keeps a genre -> books index, so no scan is needed here
+                    books = self.library.books_by_genre.get(category, [])
                     self._populate_book_list(category_frame, books)
-                    self.library._log_operation(f"Displayed books by category '{category}' successfully")
+                    self.library._log_operation("Displayed books by category '%s' successfully", category)
 
                 ttk.Button(category_frame, text="Show Category", command=show_category).pack(pady=5)
             except Exception as e:
@@ -666,9 +716,7 @@ class LibraryGUI:
 
     def _show_lend_dialog(self):
         """Show dialog for lending a book"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Lend Book")
-        dialog.geometry("300x150")
+        dialog = self._make_dialog("Lend Book", "300x150")
 
         ttk.Label(dialog, text="Book Title:").grid(row=0, column=0, pady=5, padx=5)
         title_var = tk.StringVar()
@@ -687,9 +735,7 @@ class LibraryGUI:
     def _show_edit_book_dialog(self):
         """Show dialog for editing book details"""
         # First, show a dialog to select the book to edit
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Edit Book - Select Book")
-        dialog.geometry("400x150")
+        dialog = self._make_dialog("Edit Book - Select Book", "400x150")
 
         ttk.Label(dialog, text="Enter Book Title:").grid(row=0, column=0, pady=5, padx=5)
         title_var = tk.StringVar()
@@ -706,9 +752,7 @@ class LibraryGUI:
             dialog.destroy()
 
             # Create edit dialog
-            edit_dialog = tk.Toplevel(self.root)
-            edit_dialog.title("Edit Book Details")
-            edit_dialog.geometry("400x300")
+            edit_dialog = self._make_dialog("Edit Book Details", "400x300")
 
             # Create variables for each field
             fields = {
@@ -750,9 +794,7 @@ class LibraryGUI:
 
     def _show_return_dialog(self):
         """Show dialog for returning a book"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Return Book")
-        dialog.geometry("300x150")
+        dialog = self._make_dialog("Return Book", "300x150")
 
         ttk.Label(dialog, text="Book Title:").grid(row=0, column=0, pady=5, padx=5)
         title_var = tk.StringVar()
@@ -771,49 +813,107 @@ class LibraryGUI:
     @staticmethod
     def _populate_book_list(parent: ttk.Frame, books: List[Book]):
         """Helper method to populate a book list in a frame"""
-        # Clear existing widgets
-        for widget in parent.winfo_children():
-            if isinstance(widget, ttk.Treeview):
-                widget.destroy()
+        rows = [(book.title, book.author, book.genre, book.copies, book.available_copies) for book in books]
+
+        # Refill the frame's existing list instead of stacking a new one on every call
+        tree = parent.children.get('book_list')
+        if tree is not None:
+            tree.delete(*tree.get_children())
+            LibraryGUI._insert_rows_lazily(tree, parent.children['book_list_scrollbar'], rows)
+            return
 
         # Create and set up treeview
-        tree = ttk.Treeview(parent, columns=("Title", "Author", "Genre", "Copies", "Available"))
+        tree = ttk.Treeview(parent, name='book_list', columns=("Title", "Author", "Genre", "Copies", "Available"),
+                            show='headings')
         tree.heading("Title", text="Title")
         tree.heading("Author", text="Author")
         tree.heading("Genre", text="Genre")
         tree.heading("Copies", text="Total Copies")
         tree.heading("Available", text="Available Copies")
-        tree.column("#0", width=0, stretch=tk.NO)
 
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(parent, name='book_list_scrollbar', orient="vertical", command=tree.yview)
 
-        # Populate data
-        for book in books:
-            tree.insert("", "end", values=(
-                book.title,
-                book.author,
-                book.genre,
-                book.copies,
-                book.available_copies
-            ))
+        # Populate data before the tree is mapped (also hooks the scrollbar up to the tree)
+        LibraryGUI._insert_rows_lazily(tree, scrollbar, rows)
 
         # Pack widgets
         tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    def _when_done(self, future: Future, callback: Callable[[Future], None]) -> None:
+        """Call callback(future) on the Tk thread once future has finished
+
+        Polls with after() rather than using add_done_callback, whose callback
+        runs on the worker thread, which must not touch Tk.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(_FUTURE_POLL_MS, self._when_done, future, callback)
+
+    @staticmethod
+    def _bulk_insert(tree: ttk.Treeview, rows: Sequence[tuple], iids: Optional[Sequence[str]] = None):
+        """
+        Append rows to a tree with a single call into Tcl.
+
+        The rows are handed over as one Tcl list and inserted by a small Tcl
+        proc, which replaces one Python->Tcl round trip per row with one per
+        batch. Tkinter converts the nested tuples to Tcl lists itself, so no
+        manual quoting is needed.
+
+        Args:
+            tree: Treeview to append to.
+            rows: Value tuples in display order.
+            iids: Optional item id for each row; Tk generates ids when omitted.
+        """
+        if not rows:
+            return
+        if not tree.tk.call('info', 'commands', _BULK_INSERT_PROC):
+            tree.tk.eval(_BULK_INSERT_SCRIPT)
+        tree.tk.call(_BULK_INSERT_PROC, tree._w, tuple(rows), tuple(iids or ()))
+
+    @staticmethod
+    def _insert_rows_lazily(tree: ttk.Treeview, scrollbar: ttk.Scrollbar, rows: Sequence[tuple],
+                            iids: Optional[Sequence[str]] = None):
+        """
+        Insert rows into a tree one page at a time as the user scrolls.
+
+        Only the first page is inserted up front; each time the view scrolls
+        past most of the loaded rows the next page is appended, so opening a
+        list costs O(page) Tk calls instead of O(rows).
+
+        Args:
+            tree: Treeview to fill.
+            scrollbar: The tree's vertical scrollbar, kept in sync with the view.
+            rows: Value tuples in display order.
+            iids: Optional item id for each row, as for _bulk_insert.
+        """
+        loaded = 0
+
+        def load_page():
+            nonlocal loaded
+            page = slice(loaded, loaded + _TREE_PAGE_SIZE)
+            LibraryGUI._bulk_insert(tree, rows[page], iids[page] if iids is not None else None)
+            loaded = min(loaded + _TREE_PAGE_SIZE, len(rows))
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if loaded < len(rows) and float(last) >= _TREE_PREFETCH_AT:
+                load_page()
+
+        tree.configure(yscrollcommand=on_scroll)
+        load_page()
+
     def _show_book_features_dialog(self):
         """Show dialog for managing book features"""
         # First, select a book
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Manage Book Features")
-        dialog.geometry("500x500")  # Made taller to accommodate buttons
+        dialog = self._make_dialog("Manage Book Features", "500x500")  # Made taller to accommodate buttons
 
         ttk.Label(dialog, text="Select Book:").grid(row=0, column=0, pady=5, padx=5)
         book_var = tk.StringVar()
         book_select = ttk.Combobox(dialog, textvariable=book_var)
-        book_select['values'] = [book.title for book in self.library.get_all_books()]
+        book_select['values'] = self.library.get_all_titles()
         book_select.grid(row=0, column=1, pady=5, padx=5)
 
         # Feature selection frame
@@ -842,8 +942,23 @@ class LibraryGUI:
         preview_text = tk.Text(preview_frame, height=8, width=50)
         preview_text.pack(padx=5, pady=5, fill="both", expand=True)
 
+        pending_preview = None
+
+        def cancel_pending_preview(event=None):
+            nonlocal pending_preview
+            if pending_preview is not None:
+                dialog.after_cancel(pending_preview)
+                pending_preview = None
+
+        def schedule_preview(event=None):
+            """Redraw the preview once a burst of selection changes settles"""
+            nonlocal pending_preview
+            cancel_pending_preview()
+            pending_preview = dialog.after(_PREVIEW_DEBOUNCE_MS, update_preview)
+
         def update_preview():
             """Update the preview text with current features"""
+            cancel_pending_preview()
             title = book_var.get()
             if not title:
                 return
@@ -856,20 +971,25 @@ class LibraryGUI:
             # current_features = self.library.get_book_features(title)
 
             # Start with base book description
-            preview_text.delete(1.0, tk.END)
-            preview_text.insert(tk.END, f"Title: {book.title}\n")
-            preview_text.insert(tk.END, f"Author: {book.author}\n")
-            preview_text.insert(tk.END, f"Genre: {book.genre}\n")
-            preview_text.insert(tk.END, f"Year: {book.year}\n\n")
+            parts = [
+                f"Title: {book.title}\n",
+                f"Author: {book.author}\n",
+                f"Genre: {book.genre}\n",
+                f"Year: {book.year}\n\n",
+                "Features:\n",
+            ]
 
             # Add current and selected features
-            preview_text.insert(tk.END, "Features:\n")
             if digital_var.get():
-                preview_text.insert(tk.END, "- Digital Version Available\n")
+                parts.append("- Digital Version Available\n")
             if audio_var.get():
-                preview_text.insert(tk.END, "- Audiobook Available\n")
+                parts.append("- Audiobook Available\n")
             if award_var.get():
-                preview_text.insert(tk.END, "- Award Winner\n")
+                parts.append("- Award Winner\n")
+
+            # Replace the whole text in one delete and one insert
+            preview_text.delete(1.0, tk.END)
+            preview_text.insert(tk.END, "".join(parts))
 
         def save_features():
             """Save the selected features"""
@@ -901,20 +1021,24 @@ class LibraryGUI:
         ttk.Button(buttons_frame, text="Preview", command=update_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(buttons_frame, text="Save Features", command=save_features).pack(side=tk.LEFT, padx=5)
 
-        # Initial preview
-        book_select.bind('<<ComboboxSelected>>', lambda e: update_preview())
+        # Keep the preview in step with the selected book and feature checkboxes
+        book_select.bind('<<ComboboxSelected>>', schedule_preview)
+        for check in (digital_check, audio_check, award_check):
+            check.configure(command=schedule_preview)
+        preview_text.bind('<Destroy>', cancel_pending_preview)
 
     def _logout(self):
         """Handle user logout"""
         self.current_user = None
+        # Don't leave the previous user's notifications on screen
+        if self._notifications_dialog is not None and self._notifications_dialog.winfo_exists():
+            self._notifications_dialog.withdraw()
         self.library._log_operation("log out successful")
         self.show_login_screen()
 
     def _show_waiting_list_dialog(self):
         """Show dialog for managing waiting lists"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Waiting Lists")
-        dialog.geometry("600x500")
+        dialog = self._make_dialog("Waiting Lists", "600x500")
 
         # Create notebook for different views
         notebook = ttk.Notebook(dialog)
@@ -928,11 +1052,10 @@ class LibraryGUI:
         notebook.add(available_books_frame, text="Join Waiting List")
 
         # === My Waiting Lists Tab ===
-        my_tree = ttk.Treeview(my_lists_frame, columns=("Title", "Author", "Position"))
+        my_tree = ttk.Treeview(my_lists_frame, columns=("Title", "Author", "Position"), show='headings')
         my_tree.heading("Title", text="Title")
         my_tree.heading("Author", text="Author")
         my_tree.heading("Position", text="Position in Line")
-        my_tree.column("#0", width=0, stretch=tk.NO)
 
         # Add scrollbar
         my_scrollbar = ttk.Scrollbar(my_lists_frame, orient="vertical", command=my_tree.yview)
@@ -944,14 +1067,17 @@ class LibraryGUI:
         def update_my_lists():
             my_tree.delete(*my_tree.get_children())
             positions = self.library.get_user_waiting_list_positions(self.current_user)
+            sizes = self.library.get_waiting_list_sizes()
 
             for title, position in positions.items():
-                book = self.library._get_book_case_insensitive(title)
+                # Waiting lists are keyed by the exact title, so no case-insensitive lookup is needed
+                book = self.library.books.get(title)
                 if book:
-                    my_tree.insert("", "end", values=(
+                    # Item ids are the book titles, so the selection names the book directly
+                    my_tree.insert("", "end", iid=book.title, values=(
                         book.title,
                         book.author,
-                        f"{position} of {len(self.library.get_waiting_list(title))}"
+                        f"{position} of {sizes.get(title, 0)}"
                     ))
 
         def leave_waiting_list():
@@ -960,25 +1086,24 @@ class LibraryGUI:
                 messagebox.showwarning("Warning", "Please select a book to leave its waiting list")
                 return
 
-            item = my_tree.item(selection[0])
-            title = item['values'][0]
+            title = selection[0]
 
             if self.library.remove_from_waiting_list(title, self.current_user):
                 self.library.unregister_user_from_notifications(self.current_user)
+                refresh_lists()
                 messagebox.showinfo("Success", f"Removed from waiting list for '{title}'")
-                update_my_lists()
             else:
                 messagebox.showerror("Error", "Failed to leave waiting list")
 
         ttk.Button(my_lists_frame, text="Leave Selected List", command=leave_waiting_list).pack(pady=5)
 
         # === Join Waiting List Tab ===
-        available_tree = ttk.Treeview(available_books_frame, columns=("Title", "Author", "Genre", "Waiting"))
+        available_tree = ttk.Treeview(available_books_frame, columns=("Title", "Author", "Genre", "Waiting"),
+                                      show='headings')
         available_tree.heading("Title", text="Title")
         available_tree.heading("Author", text="Author")
         available_tree.heading("Genre", text="Genre")
         available_tree.heading("Waiting", text="People Waiting")
-        available_tree.column("#0", width=0, stretch=tk.NO)
 
         # Add scrollbar
         available_scrollbar = ttk.Scrollbar(available_books_frame, orient="vertical", command=available_tree.yview)
@@ -989,15 +1114,13 @@ class LibraryGUI:
 
         def update_available_books():
             available_tree.delete(*available_tree.get_children())
-            for book in self.library.get_all_books():
-                if not book.is_available:
-                    waiting_list = self.library.get_waiting_list(book.title)
-                    available_tree.insert("", "end", values=(
-                        book.title,
-                        book.author,
-                        book.genre,
-                        len(waiting_list)
-                    ))
+            # Fetch every waiting-list size at once instead of calling into the library per book
+            sizes = self.library.get_waiting_list_sizes()
+            books = [book for book in self.library.get_all_books() if not book.is_available]
+            # Item ids are the book titles, so the selection names the book directly
+            self._insert_rows_lazily(available_tree, available_scrollbar, [
+                (book.title, book.author, book.genre, sizes.get(book.title, 0)) for book in books
+            ], [book.title for book in books])
 
         def join_waiting_list():
             selection = available_tree.selection()
@@ -1005,31 +1128,45 @@ class LibraryGUI:
                 messagebox.showwarning("Warning", "Please select a book to join its waiting list")
                 return
 
-            item = available_tree.item(selection[0])
-            title = item['values'][0]
+            title = selection[0]
 
             if self.library.add_to_waiting_list(title, self.current_user):
+                refresh_lists()
                 messagebox.showinfo("Success", f"Added to waiting list for '{title}'")
-                update_my_lists()
-                update_available_books()
             else:
                 messagebox.showerror("Error", "Failed to join waiting list")
 
         ttk.Button(available_books_frame, text="Join Selected List", command=join_waiting_list).pack(pady=5)
 
+        refresh_pending = False
+
+        def refresh_lists():
+            """Refill both tabs once the current event is handled, however often it is requested"""
+            nonlocal refresh_pending
+            if refresh_pending:
+                return
+            refresh_pending = True
+
+            def run():
+                nonlocal refresh_pending
+                refresh_pending = False
+                if my_tree.winfo_exists():
+                    update_my_lists()
+                    update_available_books()
+
+            # Scheduled on the root so the callback outlives the dialog if it closes first
+            self.root.after_idle(run)
+
         # Initial updates
         update_my_lists()
         update_available_books()
 
         # Refresh button
-        ttk.Button(dialog, text="Refresh Lists",
-                   command=lambda: [update_my_lists(), update_available_books()]).pack(pady=5)
+        ttk.Button(dialog, text="Refresh Lists", command=refresh_lists).pack(pady=5)
 
     def _show_book_navigation_dialog(self):
         """Show dialog for navigating books using different iterators."""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Browse Books")
-        dialog.geometry("600x500")
+        dialog = self._make_dialog("Browse Books", "600x500")
 
         # Create frames
         control_frame = ttk.Frame(dialog)
@@ -1069,13 +1206,12 @@ class LibraryGUI:
         ttk.Checkbutton(options_frame, text="Available Only", variable=available_only_var).pack(padx=5)
 
         # Create treeview for books
-        tree = ttk.Treeview(list_frame, columns=("Title", "Author", "Year", "Genre", "Status"))
+        tree = ttk.Treeview(list_frame, columns=("Title", "Author", "Year", "Genre", "Status"), show='headings')
         tree.heading("Title", text="Title")
         tree.heading("Author", text="Author")
         tree.heading("Year", text="Year")
         tree.heading("Genre", text="Genre")
         tree.heading("Status", text="Status")
-        tree.column("#0", width=0, stretch=tk.NO)
 
         # Add scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
@@ -1085,45 +1221,68 @@ class LibraryGUI:
         tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        def collect_rows(build_iterator: Callable[[], BookIterator], iterator_type: str) -> List[tuple]:
+            """Build the tree rows for an iterator view; runs on the worker thread"""
+            iterator = build_iterator()
+
+            rows = []
+            current_group = None
+            for book in iterator:
+                if iterator_type == 'genre' and isinstance(iterator, GenreIterator):
+                    new_group = iterator.current_genre()
+                    if new_group != current_group:
+                        current_group = new_group
+                        rows.append(("", f"== {current_group} ==", "", "", ""))
+
+                rows.append((book.title, book.author, book.year, book.genre,
+                             _AVAILABILITY_STATUS[book.is_available]))
+            return rows
+
+        list_generation = 0
+
+        def show_error(e: Exception):
+            self.library._log_operation("Book navigation failed: %s", e, is_error=True)
+            messagebox.showerror("Error", f"Failed to load books: {str(e)}")
+
         def update_list():
-            # Clear current items
-            for item in tree.get_children():
-                tree.delete(item)
+            nonlocal list_generation
 
             # Get selected iterator type
             iterator_type = iterator_var.get()
 
+            # Snapshot the books and the Tk variables here on the Tk thread; sorting and
+            # formatting the rows runs on the worker thread
             try:
-                # Configure iterator using LibrarySystem
-                kwargs = {
-                    'reverse': reverse_var.get(),
-                    'by_author': by_author_var.get(),
-                    'available_only': available_only_var.get()
-                }
-                iterator = self.library.get_iterator(iterator_type, **kwargs)
-
-                # Add items
-                current_group = None
-                for book in iterator:
-                    if iterator_type == 'genre' and isinstance(iterator, GenreIterator):
-                        new_group = iterator.current_genre()
-                        if new_group != current_group:
-                            current_group = new_group
-                            tree.insert("", "end", values=("", f"== {current_group} ==", "", "", ""))
-
-                    tree.insert("", "end", values=(
-                        book.title,
-                        book.author,
-                        book.year,
-                        book.genre,
-                        "Available" if book.is_available else "Unavailable"
-                    ))
+                build_iterator = self.library.prepare_iterator(
+                    iterator_type,
+                    reverse=reverse_var.get(),
+                    by_author=by_author_var.get(),
+                    available_only=available_only_var.get()
+                )
+            except Exception as e:
+                show_error(e)
+                return
+
+            list_generation += 1
+            generation = list_generation
+            future = self._executor.submit(collect_rows, build_iterator, iterator_type)
+            self._when_done(future, lambda done: show_rows(generation, iterator_type, done))
 
-                self.library._log_operation(
-                    f"Book navigation using {iterator_options[iterator_type]} view completed successfully")
+        def show_rows(generation: int, iterator_type: str, future: Future):
+            # Drop rows of views superseded while they were built, or that finished after the dialog closed
+            if generation != list_generation or not tree.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            try:
+                rows = future.result()
             except Exception as e:
-                self.library._log_operation(f"Book navigation failed: {str(e)}", is_error=True)
-                messagebox.showerror("Error", f"Failed to load books: {str(e)}")
+                show_error(e)
+                return
+
+            # Insert the rows a page at a time as the list scrolls
+            self._insert_rows_lazily(tree, scrollbar, rows)
+            self.library._log_operation("Book navigation using %s view completed successfully",
+                                        iterator_options[iterator_type])
 
         # Add refresh button
         ttk.Button(control_frame, text="Refresh", command=update_list).grid(row=0, column=3, padx=5)
@@ -1,16 +1,20 @@
+import copy
 import csv
-from typing import List, Dict, Set, Optional, Any
-from collections import defaultdict
+from typing import List, Dict, Set, Optional, Any, Callable, Iterator, Deque, Sequence, Tuple
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from bisect import insort
+from operator import attrgetter, itemgetter
+import heapq
 import logging
-from datetime import datetime
+import logging.handlers
 from .book import Book
 from .book_factory import BookFactory
 from .user_management import UserManager
 from .search import SearchContext
 from .notification import (NotificationCenter,
                            BookNotificationManager,
-                           UserNotificationObserver,
-                           Notification)
+                           UserNotificationObserver)
 from .book_iterator import (BookIterator,
                             ChronologicalIterator,
                             AlphabeticalIterator,
@@ -18,6 +22,57 @@ from .book_iterator import (BookIterator,
                             PopularityIterator,
                             AvailabilityIterator)
 
+logger = logging.getLogger(__name__)
+
+# Number of log records buffered before they are written to the log file; kept small
+# so a crash loses at most a few audit records
+_LOG_BUFFER_CAPACITY = 16
+
+def _norm(text: str) -> str:
+    """Normalize text for case-insensitive comparison; matches Book.title_lower"""
+    return text.casefold()
+
+
+# Defaults for read-only lookups, so reads never insert into the defaultdicts
+_EMPTY_SET: frozenset = frozenset()
+_EMPTY_LIST: tuple = ()
+
+
+def _configure_logging(log_file: str) -> None:
+    """Attach the library log file handler once; later instances reuse it"""
+    if logger.handlers:
+        return
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    # Buffer records and write them in batches; errors and shutdown flush immediately
+    handler = logging.handlers.MemoryHandler(_LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR,
+                                             target=file_handler)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+# Iterator type -> factory called with (books, library, config)
+_ITERATOR_FACTORIES = {
+    'chronological': lambda books, library, config: ChronologicalIterator(books, **config),
+    'alphabetical': lambda books, library, config: AlphabeticalIterator(books, **config),
+    'genre': lambda books, library, config: GenreIterator(books, library.books_by_genre),
+    'popularity': lambda books, library, config: PopularityIterator(books, library, **config),
+    'availability': lambda books, library, config: AvailabilityIterator(books, **config),
+}
+
+
+class _IteratorSnapshot:
+    """Copy of the library state the iterator factories read, for building an iterator on another thread"""
+
+    __slots__ = ('books_by_genre', '_waiting_list_sizes')
+
+    def __init__(self, library: 'LibrarySystem'):
+        self.books_by_genre = {genre: tuple(bucket) for genre, bucket in library.books_by_genre.items()}
+        self._waiting_list_sizes = library.get_waiting_list_sizes()
+
+    def get_waiting_list_sizes(self) -> Dict[str, int]:
+        return self._waiting_list_sizes
+
 
 class LibrarySystem:
     """Core library management system handling books, loans, and waiting lists"""
@@ -45,19 +100,31 @@ class LibrarySystem:
         self.loaned_books_file = loaned_books_file
 
         # Set up logging
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s'
-        )
+        _configure_logging(log_file)
 
         # Initialize data structures
         self.books: Dict[str, Book] = {}  # title -> Book
-        self.waiting_lists: Dict[str, List[str]] = defaultdict(list)  # title -> list of usernames
+        self._books_ci: Dict[str, str] = {}  # case-folded title -> canonical title
+        self.waiting_lists: Dict[str, Deque[str]] = defaultdict(deque)  # title -> queue of usernames
         self.user_loans: Dict[str, Set[str]] = defaultdict(set)  # username -> set of book titles
+        self.books_by_genre: Dict[str, List[Book]] = {}  # genre -> books sorted by title
+        # Books with a copy available / on loan, kept in step with each mutation
+        self._available_titles: Dict[str, Book] = {}  # title -> Book
+        self._loaned_titles: Dict[str, Book] = {}  # title -> Book
+
+        # Iterators built by get_iterator, keyed by (iterator_type, config); cleared on mutation
+        self._iter_cache: Dict[tuple, BookIterator] = {}
 
-        # Initialize search context
+        # Book files with unsaved changes; written immediately unless inside bulk()
+        self._dirty: Dict[str, bool] = {'all': False, 'available': False, 'loaned': False}
+        self._autoflush = True
+
+        # Initialize search context (keeps search indexes between queries)
         self.search_context = SearchContext()
+        # Bumped by _catalogue_changed(); tells the search context when its indexes are stale
+        self._catalogue_version = 0
+        # Cached result of get_all_titles(); cleared by _catalogue_changed()
+        self._titles: Optional[Tuple[str, ...]] = None
 
         # Initialize notification system
         self.notification_center = NotificationCenter()
@@ -76,11 +143,8 @@ class LibrarySystem:
         Returns:
             Optional[Book]: The book instance if found, or None otherwise.
         """
-        title_lower = title.lower()
-        for book_title, book in self.books.items():
-            if book_title.lower() == title_lower:
-                return book
-        return None
+        canonical_title = self._books_ci.get(_norm(title))
+        return self.books.get(canonical_title) if canonical_title else None
 
     def register_user_for_notifications(self, username: str) -> None:
         """
@@ -90,15 +154,13 @@ class LibrarySystem:
             username (str): Username of the user to register.
         """
         # Check if user already has an observer
-        for observer in self.notification_center._observers:
-            if isinstance(observer, UserNotificationObserver) and observer.username == username:
-                print(f"User {username} already has an observer")
-                return
+        if self.notification_center.get_user_observer(username) is not None:
+            logger.debug("User %s already has an observer", username)
+            return
 
-        print(f"Creating new observer for {username}")
+        logger.debug("Creating new observer for %s", username)
         observer = UserNotificationObserver(username)
         self.notification_center.attach(observer)
-        print(f"Current observers: {len(self.notification_center._observers)}")
 
     def unregister_user_from_notifications(self, username: str) -> None:
         """
@@ -108,10 +170,9 @@ class LibrarySystem:
             username (str): Username of the user to unregister.
         """
         # Find and remove the user's observer
-        for observer in self.notification_center._observers:
-            if isinstance(observer, UserNotificationObserver) and observer.username == username:
-                self.notification_center.detach(observer)
-                break
+        observer = self.notification_center.get_user_observer(username)
+        if observer is not None:
+            self.notification_center.detach(observer)
 
     def _load_books(self) -> None:
         """Load books from CSV files"""
@@ -119,43 +180,128 @@ class LibrarySystem:
             books = BookFactory.create_from_csv(self.books_file)
             for book in books:
                 self.books[book.title] = book
+                self._books_ci[book.title_lower] = book.title
+                self._index_genre(book)
+                self._track_loan_state(book)
             self._log_operation("Books loaded successfully")
         except Exception as e:
-            self._log_operation(f"Failed to load books: {str(e)}", is_error=True)
+            self._log_operation("Failed to load books: %s", e, is_error=True)
             raise
 
     def _save_books(self) -> None:
-        """Save books to all necessary CSV files"""
+        """Save books to the CSV files whose contents changed since the last save"""
         try:
             # Save all books
-            BookFactory.save_to_csv(list(self.books.values()), self.books_file)
+            if self._dirty['all']:
+                BookFactory.save_to_csv(list(self.books.values()), self.books_file)
+                self._dirty['all'] = False
 
             # Save available books
-            available_books = [book for book in self.books.values() if book.available_copies > 0]
-            BookFactory.save_to_csv(available_books, self.available_books_file)
+            if self._dirty['available']:
+                BookFactory.save_to_csv(self.get_available_books(), self.available_books_file)
+                self._dirty['available'] = False
 
             # Save loaned books
-            loaned_books = [book for book in self.books.values() if book.loaned_copies > 0]
-            BookFactory.save_to_csv(loaned_books, self.loaned_books_file)
+            if self._dirty['loaned']:
+                BookFactory.save_to_csv(self.get_loaned_books(), self.loaned_books_file)
+                self._dirty['loaned'] = False
 
             self._log_operation("Books saved successfully")
         except Exception as e:
-            self._log_operation(f"Failed to save books: {str(e)}", is_error=True)
+            self._log_operation("Failed to save books: %s", e, is_error=True)
             raise
 
+    def _books_changed(self, *files: str) -> None:
+        """
+        Mark book files as changed and save them unless saving is deferred.
+
+        Args:
+            *files (str): Which files changed: 'all', 'available' and/or 'loaned'.
+                          Defaults to all three.
+        """
+        for name in files or self._dirty:
+            self._dirty[name] = True
+        if self._autoflush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any unsaved book changes to the CSV files, and buffered log records to the log file"""
+        if any(self._dirty.values()):
+            self._save_books()
+        for handler in logger.handlers:
+            handler.flush()
+
+    @contextmanager
+    def bulk(self) -> Iterator['LibrarySystem']:
+        """
+        Defer saving book files until the block exits, then write each changed file once.
+
+        Example:
+            with library.bulk():
+                for row in rows:
+                    library.add_book(**row)
+        """
+        previous = self._autoflush
+        self._autoflush = False
+        try:
+            yield self
+        finally:
+            self._autoflush = previous
+            if previous:
+                self.flush()
+
+    def _index_genre(self, book: Book) -> None:
+        """Insert a book into its genre bucket, keeping the bucket sorted by title"""
+        insort(self.books_by_genre.setdefault(book.genre, []), book, key=attrgetter('_title_lower'))
+
+    def _unindex_genre(self, book: Book, genre: str) -> None:
+        """Remove a book from the given genre bucket, dropping the bucket once empty"""
+        bucket = self.books_by_genre.get(genre)
+        if bucket is not None and book in bucket:
+            bucket.remove(book)
+            if not bucket:
+                del self.books_by_genre[genre]
+
+    def _track_loan_state(self, book: Book) -> None:
+        """Add or drop a book in the available/loaned projections to match its copies"""
+        if book.available_copies > 0:
+            self._available_titles.setdefault(book.title, book)
+        else:
+            self._available_titles.pop(book.title, None)
+        if book.loaned_copies > 0:
+            self._loaned_titles.setdefault(book.title, book)
+        else:
+            self._loaned_titles.pop(book.title, None)
+
+    def _untrack_loan_state(self, title: str) -> None:
+        """Drop a title from the available/loaned projections"""
+        self._available_titles.pop(title, None)
+        self._loaned_titles.pop(title, None)
+
+    def _catalogue_changed(self) -> None:
+        """Drop data derived from book titles, authors and genres after a book is added, removed or edited"""
+        self._catalogue_version += 1
+        self.search_context.invalidate()
+        self._titles = None
+
+    def _invalidate_iterators(self) -> None:
+        """Drop cached iterators after books, loans or waiting lists change"""
+        self._iter_cache.clear()
+
     @staticmethod
-    def _log_operation(message: str, is_error: bool = False) -> None:
+    def _log_operation(message: str, *args: Any, is_error: bool = False) -> None:
         """
         Internal method to log an operation to the log file.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, as a %-style format string.
+            *args: Values for the format string, only formatted if the record is emitted.
             is_error (bool): If True, log as an error. Defaults to False.
         """
         if is_error:
-            logging.error(message)
+            logger.error(message, *args)
         else:
-            logging.info(message)
+            logger.info(message, *args)
 
     def add_book(self, title: str, author: str, copies: int, genre: str, year: int) -> bool:
         """
@@ -178,12 +324,17 @@ class LibrarySystem:
             else:
                 book = BookFactory.create_book(title, author, copies, genre, year)
                 self.books[title] = book
-
-            self._save_books()
-            self._log_operation(f"Book added successfully: {title}")
+                self._books_ci[book.title_lower] = title
+                self._index_genre(book)
+                self._catalogue_changed()
+            self._track_loan_state(book)
+
+            self._invalidate_iterators()
+            self._books_changed()
+            self._log_operation("Book added successfully: %s", title)
             return True
         except Exception as e:
-            self._log_operation(f"Book added fail: {title}: {str(e)}", is_error=True)
+            self._log_operation("Book added fail: %s: %s", title, e, is_error=True)
             return False
 
     def remove_book(self, title: str) -> bool:
@@ -198,19 +349,26 @@ class LibrarySystem:
         """
         try:
             if title not in self.books:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
             if self.books[title].loaned_copies > 0:
-                self._log_operation(f"Cannot remove book {title} - copies are still on loan", is_error=True)
+                self._log_operation("Cannot remove book %s - copies are still on loan", title, is_error=True)
                 return False
 
+            book = self.books[title]
+            self._unindex_genre(book, book.genre)
             del self.books[title]
-            self._save_books()
-            self._log_operation(f"Book removed successfully: {title}")
+            if self._books_ci.get(book.title_lower) == title:
+                del self._books_ci[book.title_lower]
+            self._untrack_loan_state(title)
+            self._catalogue_changed()
+            self._invalidate_iterators()
+            self._books_changed()
+            self._log_operation("Book removed successfully: %s", title)
             return True
         except Exception as e:
-            self._log_operation(f"Failed to remove book {title}: {str(e)}", is_error=True)
+            self._log_operation("Failed to remove book %s: %s", title, e, is_error=True)
             return False
 
     def loan_book(self, title: str, username: str) -> bool:
@@ -227,21 +385,19 @@ class LibrarySystem:
         try:
             book = self._get_book_case_insensitive(title)
             if not book:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
             if not book.is_available:
-                # Debug prints
-                print(f"Book {title} not available, adding {username} to waiting list")
+                logger.debug("Book %s not available, adding %s to waiting list", title, username)
 
                 # Add user to waiting list if not already in it
-                if username not in self.waiting_lists[book.title]:
+                if username not in self.waiting_lists.get(book.title, _EMPTY_LIST):
                     waiting_position = len(self.waiting_lists[book.title]) + 1
                     self.waiting_lists[book.title].append(username)
-                    self._log_operation(f"Added {username} to waiting list for {book.title}")
-
-                    # Debug prints
-                    print(f"Added to waiting list. Current list: {self.waiting_lists[book.title]}")
+                    self._invalidate_iterators()
+                    self._log_operation("Added %s to waiting list for %s", username, book.title)
+                    logger.debug("Added to waiting list. Current list: %s", self.waiting_lists[book.title])
 
                     # Notify user about their position
                     self.book_notification_manager.notify_added_to_waiting_list(
@@ -255,13 +411,20 @@ class LibrarySystem:
             # Process the loan
             if book.loan():
                 self.user_loans[username].add(book.title)
-                self._save_books()
-                self._log_operation(f"Book borrowed successfully: {book.title} by {username}")
+                self._track_loan_state(book)
+                self._invalidate_iterators()
+                # The all/available files only change when the last copy goes out,
+                # the loaned file also when the first copy does
+                if book.is_fully_loaned:
+                    self._books_changed('all', 'available', 'loaned')
+                elif book.loaned_copies == 1:
+                    self._books_changed('loaned')
+                self._log_operation("Book borrowed successfully: %s by %s", book.title, username)
                 return True
 
             return False
         except Exception as e:
-            self._log_operation(f"Failed to loan book {title}: {str(e)}", is_error=True)
+            self._log_operation("Failed to loan book %s: %s", title, e, is_error=True)
             return False
 
     def return_book(self, title: str, username: str) -> bool:
@@ -278,45 +441,40 @@ class LibrarySystem:
         try:
             book = self._get_book_case_insensitive(title)
             if not book:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
-            if title not in self.user_loans[username]:
-                self._log_operation(f"Book {title} not loaned to {username}", is_error=True)
+            if title not in self.user_loans.get(username, _EMPTY_SET):
+                self._log_operation("Book %s not loaned to %s", title, username, is_error=True)
                 return False
 
+            was_fully_loaned = book.is_fully_loaned
             if book.return_book():
                 self.user_loans[username].remove(title)
-                self._save_books()
-                self._log_operation(f"Book returned successfully: {title} by {username}")
-
-                print(f"Book returned: {title}")
-                print(f"Checking waiting list for {title}")
-                print(f"Current waiting list before notification: {self.waiting_lists[book.title]}")
-
-                # Notify next user in waiting list
-                if self.waiting_lists[book.title]:
-                    next_user = self.waiting_lists[book.title][0]
-                    print(f"Notifying next user: {next_user}")
-                    # Create notification for book availability
-                    notification = Notification(
-                        type='BOOK_AVAILABLE',
-                        message=f"The book '{title}' is now available for you to borrow",
-                        timestamp=datetime.now(),
-                        book_title=title,
-                        user=next_user
-                    )
-                    self.notification_center.add_notification(notification)
-                    # Remove user from waiting list after notification
-                    self.waiting_lists[book.title].pop(0)
-                    self._log_operation(f"Notified {next_user} that {title} is available")
+                self._track_loan_state(book)
+                self._invalidate_iterators()
+                # Mirror of loan_book: only boundary crossings change the files
+                if was_fully_loaned:
+                    self._books_changed('all', 'available', 'loaned')
+                elif book.loaned_copies == 0:
+                    self._books_changed('loaned')
+                self._log_operation("Book returned successfully: %s by %s", title, username)
+
+                waiting_list = self.waiting_lists.get(book.title, _EMPTY_LIST)
+                logger.debug("Book returned: %s, waiting list: %s", title, waiting_list)
+
+                # Notify next user in waiting list, removing them from it
+                if waiting_list:
+                    next_user = waiting_list.popleft()
+                    logger.debug("Notifying next user: %s", next_user)
+                    self.book_notification_manager.notify_book_available(book.title, next_user)
+                    self._log_operation("Notified %s that %s is available", next_user, title)
 
                 return True
 
             return False
         except Exception as e:
-            self._log_operation(f"Failed to return book {title}: {str(e)}", is_error=True)
-            print(f"Error in return_book: {str(e)}")
+            self._log_operation("Failed to return book %s: %s", title, e, is_error=True)
             return False
 
     def update_book(self, title: str, updates: dict) -> bool:
@@ -333,24 +491,34 @@ class LibrarySystem:
         try:
             book = self._get_book_case_insensitive(title)
             if not book:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
             # Validate updates
             if 'copies' in updates and updates['copies'] < book.loaned_copies:
                 self._log_operation("Cannot reduce copies below number of loaned copies", is_error=True)
                 return False
+            # Check every new value with the constructor's rules before changing anything, so a
+            # rejected update leaves the book, its indexes and the book files untouched
+            Book(title=updates.get('title', book.title), author=updates.get('author', book.author),
+                 genre=updates.get('genre', book.genre), year=updates.get('year', book.year),
+                 copies=updates.get('copies', book.copies), loaned_copies=book.loaned_copies)
 
             # Apply updates
+            old_title, old_title_lower, old_genre = book.title, book.title_lower, book.genre
             if 'title' in updates and updates['title'] != book.title:
                 # Handle title change (needs special care as it's the key in self.books)
                 new_title = updates['title']
-                if new_title in self.books and new_title.lower() != title.lower():
-                    self._log_operation(f"Book with title '{new_title}' already exists", is_error=True)
+                if new_title in self.books and _norm(new_title) != old_title_lower:
+                    self._log_operation("Book with title '%s' already exists", new_title, is_error=True)
                     return False
-                del self.books[book.title]
                 book.title = new_title
+                del self.books[old_title]
+                self._untrack_loan_state(old_title)
                 self.books[new_title] = book
+                if self._books_ci.get(old_title_lower) == old_title:
+                    del self._books_ci[old_title_lower]
+                self._books_ci[book.title_lower] = new_title
 
             if 'author' in updates:
                 book.author = updates['author']
@@ -361,21 +529,30 @@ class LibrarySystem:
             if 'copies' in updates:
                 book.update_copies(updates['copies'])
 
-            self._save_books()
-            self._log_operation(f"Book '{title}' updated successfully")
+            # Title and genre both determine the book's position in the genre index
+            if book.title != old_title or book.genre != old_genre:
+                self._unindex_genre(book, old_genre)
+                self._index_genre(book)
+            self._track_loan_state(book)
+
+            self._catalogue_changed()
+            self._invalidate_iterators()
+            self._books_changed()
+            self._log_operation("Book '%s' updated successfully", title)
             return True
 
         except Exception as e:
-            self._log_operation(f"Failed to update book {title}: {str(e)}", is_error=True)
+            self._log_operation("Failed to update book %s: %s", title, e, is_error=True)
             return False
 
     def _load_features(self) -> None:
         """Load book features from CSV"""
         try:
-            with open(self.features_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.book_features[row['book_title']] = row['features'].split(',')
+            with open(self.features_file, 'r', encoding='utf-8', newline='') as file:
+                # Columns are (book_title, features) as written by _save_features
+                reader = csv.reader(file)
+                next(reader, None)
+                self.book_features = {row[0]: row[1].split(',') for row in reader if row}
         except FileNotFoundError:
             # Create file if it doesn't exist
             self._save_features()
@@ -402,12 +579,12 @@ class LibrarySystem:
                     # Remove empty feature lists
                     self.book_features.pop(title, None)
                 self._save_features()
-                self._log_operation(f"Updated features for book: {title}")
+                self._log_operation("Updated features for book: %s", title)
                 return True
-            self._log_operation(f"Failed to update features: book {title} not found", is_error=True)
+            self._log_operation("Failed to update features: book %s not found", title, is_error=True)
             return False
         except Exception as e:
-            self._log_operation(f"Error updating features: {str(e)}", is_error=True)
+            self._log_operation("Error updating features: %s", e, is_error=True)
             return False
 
     def get_book_features(self, title: str) -> List[str]:
@@ -428,18 +605,19 @@ class LibrarySystem:
         try:
             book = self._get_book_case_insensitive(title)
             if not book:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
             # Check if user is already in waiting list
-            if username in self.waiting_lists[book.title]:
-                self._log_operation(f"User {username} is already in waiting list for {book.title}", is_error=True)
+            if username in self.waiting_lists.get(book.title, _EMPTY_LIST):
+                self._log_operation("User %s is already in waiting list for %s", username, book.title, is_error=True)
                 return False
 
             # Add to waiting list
             waiting_position = len(self.waiting_lists[book.title]) + 1
             self.waiting_lists[book.title].append(username)
-            self._log_operation(f"Added {username} to waiting list for {book.title}")
+            self._invalidate_iterators()
+            self._log_operation("Added %s to waiting list for %s", username, book.title)
 
             # Notify user about their position
             self.book_notification_manager.notify_added_to_waiting_list(
@@ -448,7 +626,7 @@ class LibrarySystem:
             return True
 
         except Exception as e:
-            self._log_operation(f"Failed to add to waiting list: {str(e)}", is_error=True)
+            self._log_operation("Failed to add to waiting list: %s", e, is_error=True)
             return False
 
     def remove_from_waiting_list(self, title: str, username: str) -> bool:
@@ -465,19 +643,20 @@ class LibrarySystem:
         try:
             book = self._get_book_case_insensitive(title)
             if not book:
-                self._log_operation(f"Book not found: {title}", is_error=True)
+                self._log_operation("Book not found: %s", title, is_error=True)
                 return False
 
-            if username in self.waiting_lists[book.title]:
+            if username in self.waiting_lists.get(book.title, _EMPTY_LIST):
                 self.waiting_lists[book.title].remove(username)
-                self._log_operation(f"Removed {username} from waiting list for {book.title}")
+                self._invalidate_iterators()
+                self._log_operation("Removed %s from waiting list for %s", username, book.title)
                 return True
 
-            self._log_operation(f"User {username} not found in waiting list for {book.title}", is_error=True)
+            self._log_operation("User %s not found in waiting list for %s", username, book.title, is_error=True)
             return False
 
         except Exception as e:
-            self._log_operation(f"Failed to remove from waiting list: {str(e)}", is_error=True)
+            self._log_operation("Failed to remove from waiting list: %s", e, is_error=True)
             return False
 
     def get_user_waiting_list_positions(self, username: str) -> dict:
@@ -492,8 +671,11 @@ class LibrarySystem:
         """
         positions = {}
         for title, waiting_list in self.waiting_lists.items():
-            if username in waiting_list:
+            # index() both tests membership and finds the position in a single scan
+            try:
                 positions[title] = waiting_list.index(username) + 1
+            except ValueError:
+                pass
         return positions
 
     def notify_next_in_line(self, title: str) -> bool:
@@ -510,7 +692,7 @@ class LibrarySystem:
         if not book:
             return False
 
-        waiting_list = self.waiting_lists.get(book.title, [])
+        waiting_list = self.waiting_lists.get(book.title, _EMPTY_LIST)
         if waiting_list:
             next_user = waiting_list[0]
             self.book_notification_manager.notify_book_available(book.title, next_user)
@@ -519,37 +701,82 @@ class LibrarySystem:
 
     def get_user_loans(self, username: str) -> List[str]:
         """Get list of books currently loaned to a user"""
-        return list(self.user_loans[username])
+        return list(self.user_loans.get(username, _EMPTY_SET))
 
-    def get_waiting_list(self, title: str) -> List[str]:
+    def get_waiting_list(self, title: str) -> Sequence[str]:
         """Get the waiting list for a book"""
-        return self.waiting_lists.get(title, [])
+        return self.waiting_lists.get(title, _EMPTY_LIST)
+
+    def get_waiting_list_sizes(self) -> Dict[str, int]:
+        """Get the number of users waiting for each book that has a non-empty waiting list"""
+        return {title: len(waiting_list) for title, waiting_list in self.waiting_lists.items() if waiting_list}
 
     def get_available_books(self) -> List[Book]:
-        """Get list of all available books"""
-        return [book for book in self.books.values() if book.available_copies > 0]
+        """Get list of all available books, in catalogue order"""
+        # The projection is filled in loan/return order; filter the catalogue by it so the
+        # file and GUI lists keep a stable order
+        available = self._available_titles
+        return [book for title, book in self.books.items() if title in available]
 
     def get_loaned_books(self) -> List[Book]:
-        """Get list of all books that have at least one copy loaned"""
-        return [book for book in self.books.values() if book.loaned_copies > 0]
+        """Get list of all books that have at least one copy loaned, in catalogue order"""
+        loaned = self._loaned_titles
+        return [book for title, book in self.books.items() if title in loaned]
 
     def get_all_books(self) -> List[Book]:
         """Get list of all books"""
         return list(self.books.values())
 
+    def get_all_titles(self) -> Tuple[str, ...]:
+        """Get the titles of all books, cached until a book is added, removed or edited"""
+        if self._titles is None:
+            self._titles = tuple(self.books)
+        return self._titles
+
+    def get_most_wanted_books(self, limit: Optional[int] = None) -> List[tuple]:
+        """
+        Get books that have users waiting, most requested first
+
+        Args:
+            limit: Maximum number of books to return, or None for all of them.
+
+        Returns:
+            List of (book, waiting list size) pairs.
+        """
+        # Only titles with a non-empty waiting list are ranked, not the whole collection
+        ranked = [(self.books[title], size) for title, size in self.get_waiting_list_sizes().items()
+                  if title in self.books]
+        if limit is None:
+            ranked.sort(key=itemgetter(1), reverse=True)
+            return ranked
+        return heapq.nlargest(limit, ranked, key=itemgetter(1))
+
+    def get_most_borrowed_books(self, limit: int = 10) -> List[Book]:
+        """
+        Get the most borrowed books, skipping books that were never borrowed
+
+        Args:
+            limit: Maximum number of books to return.
+
+        Returns:
+            List of books ordered by total_borrows, highest first.
+        """
+        top = heapq.nlargest(limit, self.books.values(), key=attrgetter('total_borrows'))
+        return [book for book in top if book.total_borrows > 0]
+
     @staticmethod
     def configure_iterator(iterator_type: str, **kwargs) -> Dict[str, Any]:
         """
         Configure additional arguments for specific iterator types.
         Args:
             iterator_type: The type of iterator.
-            **kwargs: Additional keyword arguments (e.g., reverse, by_author).
+            **kwargs: Additional keyword arguments (e.g., reverse, by_author, limit).
 
         Returns:
             A dictionary of configuration arguments for the iterator.
         """
         if iterator_type == 'chronological':
-            return {'reverse': kwargs.get('reverse', False)}
+            return {'reverse': kwargs.get('reverse', False), 'limit': kwargs.get('limit')}
         elif iterator_type == 'alphabetical':
             return {'by_author': kwargs.get('by_author', False)}
         elif iterator_type == 'availability':
@@ -557,7 +784,7 @@ class LibrarySystem:
         elif iterator_type == 'genre':
             return {}
         elif iterator_type == 'popularity':
-            return {}
+            return {'limit': kwargs.get('limit')}
         else:
             raise ValueError(f"Unknown iterator type: {iterator_type}")
 
@@ -565,6 +792,12 @@ class LibrarySystem:
         """
         Get a specific type of book iterator.
 
+        Iterators are cached per type and configuration until the next change
+        to the books, loans or waiting lists, so repeated requests for the same
+        view do not sort the catalogue again. Each call returns its own shallow
+        copy of the cached iterator: the sorted books are shared, iteration
+        state such as GenreIterator.current_genre() is not.
+
         Args:
             iterator_type: Type of iterator.
             **kwargs: Additional arguments for specific iterators.
@@ -572,21 +805,49 @@ class LibrarySystem:
         Returns:
             BookIterator: The requested iterator.
         """
-        books = list(self.books.values())
         config = self.configure_iterator(iterator_type, **kwargs)
+        cache_key = (iterator_type, tuple(sorted(config.items())))
+        iterator = self._iter_cache.get(cache_key)
+        if iterator is not None:
+            return copy.copy(iterator)
 
-        if iterator_type == 'chronological':
-            return ChronologicalIterator(books, **config)
-        elif iterator_type == 'alphabetical':
-            return AlphabeticalIterator(books, **config)
-        elif iterator_type == 'genre':
-            return GenreIterator(books)
-        elif iterator_type == 'popularity':
-            return PopularityIterator(books, self)
-        elif iterator_type == 'availability':
-            return AvailabilityIterator(books, **config)
-        else:
+        # Every iterator copies what it keeps (GenreIterator copies the genre buckets), so pass a view
+        books = self.books.values()
+
+        try:
+            factory = _ITERATOR_FACTORIES[iterator_type]
+        except KeyError:
             raise ValueError(f"Unknown iterator type: {iterator_type}")
+        iterator = factory(books, self, config)
+
+        self._iter_cache[cache_key] = iterator
+        return copy.copy(iterator)
+
+    def prepare_iterator(self, iterator_type: str, **kwargs) -> Callable[[], BookIterator]:
+        """
+        Snapshot the books for an iterator and return a function that builds it.
+
+        Like prepare_search, the snapshot (books, genre buckets and waiting-list
+        sizes) is taken on the calling thread and the returned function only
+        reads it, so the sorting may run on another thread. The result is not
+        added to the iterator cache.
+
+        Args:
+            iterator_type: Type of iterator.
+            **kwargs: Additional arguments for specific iterators.
+
+        Returns:
+            Callable[[], BookIterator]: Builds and returns the requested iterator
+        """
+        config = self.configure_iterator(iterator_type, **kwargs)
+        factory = _ITERATOR_FACTORIES[iterator_type]
+        books = self.get_all_books()
+        snapshot = _IteratorSnapshot(self)
+
+        def build_iterator() -> BookIterator:
+            return factory(books, snapshot, config)
+
+        return build_iterator
 
     def search_books(self, strategy: str, query: str) -> List[Book]:
         """
@@ -599,11 +860,36 @@ class LibrarySystem:
         Returns:
             List[Book]: List of books matching the search criteria
         """
-        try:
-            search_context = SearchContext()
-            results = search_context.search(self.get_all_books(), strategy, query)
-            self._log_operation(f"Search {strategy}='{query}' completed successfully")
-            return results
-        except Exception as e:
-            self._log_operation(f"Search failed for {strategy}='{query}': {str(e)}", is_error=True)
-            raise
+        return self.prepare_search(strategy, query)()
+
+    def prepare_search(self, strategy: str, query: str) -> Callable[[], List[Book]]:
+        """
+        Snapshot the books for a search and return a function that runs it.
+
+        The snapshot is taken on the calling thread. The returned function only
+        reads that snapshot and the search context's index cache (which is
+        swapped as a whole), so it may run on another thread, e.g. a GUI worker,
+        while the calling thread keeps changing books.
+
+        Args:
+            strategy: Search strategy to use ('title', 'author', 'genre', 'year')
+            query: Search query string
+
+        Returns:
+            Callable[[], List[Book]]: Runs the search and returns the matching books
+        """
+        # Read the version before the books, so an index is never stored under a newer
+        # version than the books it was built from
+        version = self._catalogue_version
+        books = self.get_all_books()
+
+        def run_search() -> List[Book]:
+            try:
+                results = self.search_context.search(books, strategy, query, version)
+                self._log_operation("Search %s='%s' completed successfully", strategy, query)
+                return results
+            except Exception as e:
+                self._log_operation("Search failed for %s='%s': %s", strategy, query, e, is_error=True)
+                raise
+
+        return run_search
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional
 from dataclasses import dataclass
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # Observer Pattern Interfaces
@@ -30,7 +33,8 @@ class Subject(ABC):
 
     def notify(self, notification: 'Notification') -> None:
         """Notify all observers"""
-        for observer in self._observers:
+        # Iterate over a snapshot so observers may attach/detach from update()
+        for observer in tuple(self._observers):
             observer.update(notification)
 
 
@@ -50,6 +54,38 @@ class NotificationCenter(Subject):
     def __init__(self):
         super().__init__()
         self.notifications: Dict[str, List[Notification]] = {}  # username -> notifications
+        self._user_observers: Dict[str, 'UserNotificationObserver'] = {}  # username -> observer
+
+    def attach(self, observer: Observer) -> None:
+        """Attach an observer, indexing user observers by username"""
+        if isinstance(observer, UserNotificationObserver):
+            self._user_observers[observer.username] = observer
+        else:
+            super().attach(observer)
+
+    def detach(self, observer: Observer) -> None:
+        """Detach an observer"""
+        if isinstance(observer, UserNotificationObserver):
+            if self._user_observers.get(observer.username) is observer:
+                del self._user_observers[observer.username]
+        else:
+            super().detach(observer)
+
+    @property
+    def observer_count(self) -> int:
+        """Number of attached observers, user observers included"""
+        return len(self._observers) + len(self._user_observers)
+
+    def get_user_observer(self, username: str) -> Optional['UserNotificationObserver']:
+        """Get the observer registered for a user, if any"""
+        return self._user_observers.get(username)
+
+    def notify(self, notification: 'Notification') -> None:
+        """Notify generic observers and the observer of the notified user"""
+        super().notify(notification)
+        observer = self._user_observers.get(notification.user)
+        if observer is not None:
+            observer.update(notification)
 
     def add_notification(self, notification: Notification) -> None:
         """Add a new notification and notify observers"""
@@ -95,15 +131,14 @@ class BookNotificationManager:
 
     def notify_book_available(self, book_title: str, user: str) -> None:
         """Notify user that a book is available"""
-        print(f"Creating notification for {username} about {title}")  # Debug print
+        logger.debug("Creating notification for %s about %s", user, book_title)
         notification = Notification(
             type='BOOK_AVAILABLE',
-            message=f"The book '{title}' is now available for you to borrow",
+            message=f"The book '{book_title}' is now available for you to borrow",
             timestamp=datetime.now(),
-            book_title=title,
-            user=username
+            book_title=book_title,
+            user=user
         )
-        print("Adding notification to center")  # Debug print
         self.notification_center.add_notification(notification)
 
     def notify_book_due_soon(self, book_title: str, user: str, days_left: int) -> None:
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
+from collections import defaultdict
+from operator import attrgetter
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 from .book import Book
 
+_NO_POSITIONS: Set[int] = frozenset()
+
 
 class SearchStrategy(ABC):
     """Abstract base class for search strategies"""
@@ -21,31 +25,107 @@ class SearchStrategy(ABC):
         pass
 
 
-class TitleSearchStrategy(SearchStrategy):
-    """Strategy for searching books by title"""
+class IndexedSearchStrategy(SearchStrategy):
+    """Search strategy that can also answer queries from a reusable index over the books"""
+
+    @abstractmethod
+    def build_index(self, books: List[Book]) -> Any:
+        """Build an index over books that search_index() can query repeatedly"""
+        pass
+
+    @abstractmethod
+    def search_index(self, index: Any, query: str) -> List[Book]:
+        """Search a prebuilt index; same results as search() on the indexed books"""
+        pass
+
+
+class SubstringIndex:
+    """
+    Trigram index over one case-folded key of a fixed list of books.
+
+    Answers "which keys contain this substring" by intersecting the posting
+    sets of the query's trigrams and verifying only the surviving candidates,
+    so results are exactly those of a linear `query in key` scan, in the same
+    order.
+    """
+
+    GRAM = 3
+
+    __slots__ = ('_books', '_keys', '_postings')
+
+    def __init__(self, books: Iterable[Book], key: Callable[[Book], str]):
+        self._books: List[Book] = list(books)
+        self._keys: List[str] = [key(book) for book in self._books]
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        gram = self.GRAM
+        for position, text in enumerate(self._keys):
+            for start in range(len(text) - gram + 1):
+                postings[text[start:start + gram]].add(position)
+        self._postings: Dict[str, Set[int]] = dict(postings)
+
+    def search(self, query: str) -> List[Book]:
+        """
+        Get the books whose key contains query, in index order
+
+        Args:
+            query: Case-folded substring to look for
+
+        Returns:
+            List[Book]: Matching books
+        """
+        gram = self.GRAM
+        if len(query) < gram:
+            # Too short to have a trigram: every book is a candidate
+            candidates = range(len(self._keys))
+        else:
+            grams = {query[start:start + gram] for start in range(len(query) - gram + 1)}
+            postings = sorted((self._postings.get(g, _NO_POSITIONS) for g in grams), key=len)
+            if not postings[0]:
+                return []
+            candidates = sorted(postings[0].intersection(*postings[1:]))
+
+        keys, books = self._keys, self._books
+        return [books[position] for position in candidates if query in keys[position]]
+
+
+class SubstringSearchStrategy(IndexedSearchStrategy):
+    """Base strategy for case-insensitive substring search on one book field"""
+
+    # Attribute holding the field's case-folded key on Book
+    key_attr: str
 
     def search(self, books: List[Book], query: str) -> List[Book]:
-        query = query.lower()
-        return [book for book in books if query in book.title.lower()]
+        # Compare against the case-folded key the book keeps, not a fresh lowercase copy per book
+        query = query.casefold()
+        key_attr = self.key_attr
+        return [book for book in books if query in getattr(book, key_attr)]
+
+    def build_index(self, books: List[Book]) -> SubstringIndex:
+        return SubstringIndex(books, attrgetter(self.key_attr))
+
+    def search_index(self, index: SubstringIndex, query: str) -> List[Book]:
+        return index.search(query.casefold())
 
 
-class AuthorSearchStrategy(SearchStrategy):
+class TitleSearchStrategy(SubstringSearchStrategy):
+    """Strategy for searching books by title"""
+
+    key_attr = '_title_lower'
+
+
+class AuthorSearchStrategy(SubstringSearchStrategy):
     """Strategy for searching books by author"""
 
-    def search(self, books: List[Book], query: str) -> List[Book]:
-        query = query.lower()
-        return [book for book in books if query in book.author.lower()]
+    key_attr = '_sort_author'
 
 
-class GenreSearchStrategy(SearchStrategy):
+class GenreSearchStrategy(SubstringSearchStrategy):
     """Strategy for searching books by genre"""
 
-    def search(self, books: List[Book], query: str) -> List[Book]:
-        query = query.lower()
-        return [book for book in books if query in book.genre.lower()]
+    key_attr = '_genre_lower'
 
 
-class YearSearchStrategy(SearchStrategy):
+class YearSearchStrategy(IndexedSearchStrategy):
     """Strategy for searching books by publication year"""
 
     def search(self, books: List[Book], query: str) -> List[Book]:
@@ -55,6 +135,20 @@ class YearSearchStrategy(SearchStrategy):
         except ValueError:
             return []
 
+    def build_index(self, books: List[Book]) -> Dict[int, List[Book]]:
+        by_year: Dict[int, List[Book]] = defaultdict(list)
+        for book in books:
+            by_year[book.year].append(book)
+        return dict(by_year)
+
+    def search_index(self, index: Dict[int, List[Book]], query: str) -> List[Book]:
+        try:
+            year = int(query)
+        except ValueError:
+            return []
+        # Copy so callers can't modify the index through the result
+        return list(index.get(year, ()))
+
 
 class SearchContext:
     """Context class that manages the search strategies"""
@@ -66,19 +160,32 @@ class SearchContext:
             'genre': GenreSearchStrategy(),
             'year': YearSearchStrategy()
         }
+        # (version, strategy -> index) for the books last searched with a version
+        self._indexes: Tuple[Optional[Hashable], Dict[str, Any]] = (None, {})
+
+    def invalidate(self) -> None:
+        """Forget the search indexes"""
+        self._indexes = (None, {})
 
     def get_available_strategies(self) -> List[str]:
         """Get list of available search strategies"""
         return list(self._strategies.keys())
 
-    def search(self, books: List[Book], strategy: str, query: str) -> List[Book]:
+    def search(self, books: Iterable[Book], strategy: str, query: str,
+               version: Optional[Hashable] = None) -> List[Book]:
         """
         Perform search using specified strategy
 
+        Without a version the books are scanned. With one, indexed strategies
+        index the books on first use and answer later searches passing the same
+        version from that index; the caller must pass a new version whenever
+        the books or their fields change.
+
         Args:
-            books: List of books to search through
+            books: Books to search through
             strategy: Name of the search strategy to use
             query: Search query string
+            version: Optional token identifying this state of the books
 
         Returns:
             List[Book]: List of books matching the search criteria
@@ -89,7 +196,21 @@ class SearchContext:
         if strategy not in self._strategies:
             raise ValueError(f"Unknown search strategy: {strategy}")
 
-        return self._strategies[strategy].search(books, query)
+        search_strategy = self._strategies[strategy]
+        if version is None or not isinstance(search_strategy, IndexedSearchStrategy):
+            return search_strategy.search(list(books), query)
+
+        # Read the cache as one tuple so a search on another thread (e.g. a GUI
+        # worker) never pairs one version with another version's indexes
+        indexed_version, indexes = self._indexes
+        if indexed_version != version:
+            indexes = {}
+            self._indexes = (version, indexes)
+        index = indexes.get(strategy)
+        if index is None:
+            # Snapshot the books in one step before indexing them
+            index = indexes[strategy] = search_strategy.build_index(list(books))
+        return search_strategy.search_index(index, query)
 
 
 # Example usage:
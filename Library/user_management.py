@@ -1,7 +1,23 @@
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import csv
-from typing import Optional, List
-from werkzeug.security import generate_password_hash, check_password_hash
+import os
+from typing import Optional, List, Dict, Iterator, Tuple
+
+
+# werkzeug is imported on first use: importing werkzeug.security loads the whole
+# werkzeug package (HTTP server, test client, ...), which would otherwise make up
+# about half of the application's start-up import time.
+def _hash_password(password: str, method: str) -> str:
+    """Hash a password with the given werkzeug method"""
+    from werkzeug.security import generate_password_hash
+    return generate_password_hash(password, method=method)
+
+
+def _verify_password(password_hash: str, password: str) -> bool:
+    """Check a password against a werkzeug hash"""
+    from werkzeug.security import check_password_hash
+    return check_password_hash(password_hash, password)
 
 
 @dataclass
@@ -11,14 +27,14 @@ class User:
     password_hash: str
 
     @classmethod
-    def create(cls, username: str, password: str) -> 'User':
-        """Create a new user with encrypted password"""
-        password_hash = generate_password_hash(password)
+    def create(cls, username: str, password: str, method: str = 'scrypt') -> 'User':
+        """Create a new user with encrypted password, hashed with the given werkzeug method"""
+        password_hash = _hash_password(password, method)
         return cls(username=username, password_hash=password_hash)
 
     def verify_password(self, password: str) -> bool:
         """Verify if the given password matches the hash"""
-        return check_password_hash(self.password_hash, password)
+        return _verify_password(self.password_hash, password)
 
     def to_dict(self) -> dict:
         """Convert user to dictionary format for CSV storage"""
@@ -28,36 +44,125 @@ class User:
         }
 
 
+def _hash_params(password_hash: str) -> str:
+    """Get the method and cost prefix of a werkzeug hash, e.g. 'scrypt:32768:8:1'"""
+    return password_hash.split('$', 1)[0]
+
+
 class UserManager:
-    """Manages user operations including registration, authentication, and storage"""
+    """Manages user operations including registration, authentication, and storage
+
+    The users file is an append-only log: registrations append a row and
+    deletions append a tombstone row with an empty password hash. Loading
+    replays the log (later rows win) and compacts it once it has grown to
+    more than twice the number of live users.
+    """
+
+    FIELDNAMES = ['username', 'password_hash']
 
-    def __init__(self, users_file: str = 'Data/users.csv'):
+    # Hashes checked for unknown usernames so they cost as much as a wrong password, per hash method
+    _dummy_hashes: Dict[str, str] = {}
+
+    def __init__(self, users_file: str = 'Data/users.csv', hash_method: str = 'scrypt'):
+        """
+        Args:
+            users_file: Path to the users CSV file.
+            hash_method: werkzeug hash method and cost parameters for new hashes,
+                e.g. 'scrypt', 'scrypt:16384:8:1' or 'pbkdf2:sha256:600000'.
+                Stored hashes made with other parameters are upgraded on login.
+        """
         self.users_file = users_file
+        self.hash_method = hash_method
         self.users: dict[str, User] = {}
+        # Rows waiting to be appended to the users file while inside bulk()
+        self._pending_rows: Optional[List[Tuple[str, str]]] = None
         self._load_users()
 
     def _load_users(self) -> None:
-        """Load users from CSV file"""
+        """Load users from CSV file, replaying registrations and deletions in order"""
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    user = User(
-                        username=row['username'],
-                        password_hash=row['password_hash']
-                    )
-                    self.users[user.username] = user
+            rows = 0
+            with open(self.users_file, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is not None:
+                    username_i, hash_i = map(header.index, self.FIELDNAMES)
+                    for row in reader:
+                        if not row:
+                            continue
+                        rows += 1
+                        username, password_hash = row[username_i], row[hash_i]
+                        if password_hash:
+                            self.users[username] = User(username=username, password_hash=password_hash)
+                        else:
+                            # Tombstone left by delete_user
+                            self.users.pop(username, None)
+            if header is None:
+                # An empty file has no header for appended rows to follow, so write one now
+                self._save_users()
+            elif rows > 2 * len(self.users):
+                self.compact()
         except FileNotFoundError:
             # Create the file if it doesn't exist
             self._save_users()
 
     def _save_users(self) -> None:
-        """Save users to CSV file"""
-        with open(self.users_file, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=['username', 'password_hash'])
-            writer.writeheader()
-            for user in self.users.values():
-                writer.writerow(user.to_dict())
+        """Rewrite the users CSV file with only the current users"""
+        # The rewrite already reflects any rows still buffered by bulk()
+        if self._pending_rows:
+            self._pending_rows.clear()
+        # Write a temporary file and swap it in, so a crash never leaves a truncated file
+        tmp_file = self.users_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows((user.username, user.password_hash) for user in self.users.values())
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_file, self.users_file)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_file)
+            raise
+
+    def _append_user_row(self, username: str, password_hash: str) -> None:
+        """Append a single registration (or, with an empty hash, deletion) row to the users file"""
+        if self._pending_rows is not None:
+            self._pending_rows.append((username, password_hash))
+        else:
+            self._append_user_rows([(username, password_hash)])
+
+    def _append_user_rows(self, rows: List[Tuple[str, str]]) -> None:
+        """Append rows to the users file in a single write"""
+        with open(self.users_file, 'a', newline='', encoding='utf-8') as file:
+            csv.writer(file).writerows(rows)
+
+    @contextmanager
+    def bulk(self) -> Iterator['UserManager']:
+        """
+        Buffer users file rows until the block exits, then append them in one write.
+
+        Example:
+            with user_manager.bulk():
+                for username, password in accounts:
+                    user_manager.register(username, password)
+        """
+        if self._pending_rows is not None:
+            # Nested block: the outermost one writes the rows
+            yield self
+            return
+        self._pending_rows = []
+        try:
+            yield self
+        finally:
+            rows, self._pending_rows = self._pending_rows, None
+            if rows:
+                self._append_user_rows(rows)
+
+    def compact(self) -> None:
+        """Rewrite the users file without superseded rows and tombstones"""
+        self._save_users()
 
     def register(self, username: str, password: str) -> bool:
         """
@@ -70,9 +175,9 @@ class UserManager:
         if username in self.users:
             return False
 
-        user = User.create(username, password)
+        user = User.create(username, password, self.hash_method)
         self.users[username] = user
-        self._save_users()
+        self._append_user_row(username, user.password_hash)
         return True
 
     def authenticate(self, username: str, password: str) -> bool:
@@ -81,9 +186,26 @@ class UserManager:
         Returns True if credentials are valid, False otherwise
         """
         user = self.users.get(username)
-        if not user:
-            return False
-        return user.verify_password(password)
+        # Always run one hash verification, whether or not the user exists, and
+        # combine the results without short-circuiting
+        dummy_hash = self._get_dummy_hash()
+        target_hash = user.password_hash if user is not None else dummy_hash
+        password_ok = _verify_password(target_hash, password)
+        authenticated = password_ok & (user is not None)
+
+        # Rehash on login when the stored hash predates the configured method/cost
+        if authenticated and _hash_params(user.password_hash) != _hash_params(dummy_hash):
+            user.password_hash = _hash_password(password, self.hash_method)
+            self._append_user_row(username, user.password_hash)
+        return authenticated
+
+    def _get_dummy_hash(self) -> str:
+        """Get the shared dummy password hash for this manager's method, generating it on first use"""
+        dummy_hash = self._dummy_hashes.get(self.hash_method)
+        if dummy_hash is None:
+            dummy_hash = _hash_password(os.urandom(16).hex(), self.hash_method)
+            self._dummy_hashes[self.hash_method] = dummy_hash
+        return dummy_hash
 
     def get_user(self, username: str) -> Optional[User]:
         """Get a user by username"""
@@ -101,5 +223,5 @@ class UserManager:
         if username not in self.users:
             return False
         del self.users[username]
-        self._save_users()
+        self._append_user_row(username, '')
         return True
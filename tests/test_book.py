@@ -45,6 +45,27 @@ class TestBook(unittest.TestCase):
         with self.assertRaises(ValueError):
             Book(title="Test Book", author="Test Author", copies=3, genre="Test Genre", year="2024")
 
+    def test_title_and_author_setters(self):
+        """Test renaming a book refreshes its lookup key and validates the value"""
+        self.valid_book.title = "Renamed Book"
+        self.valid_book.author = "Other Author"
+        self.assertEqual(self.valid_book.title, "Renamed Book")
+        self.assertEqual(self.valid_book.title_lower, "renamed book")
+        self.assertEqual(self.valid_book.author, "Other Author")
+
+        with self.assertRaises(ValueError):
+            self.valid_book.title = ""
+        with self.assertRaises(ValueError):
+            self.valid_book.author = None
+        self.assertEqual(self.valid_book.title, "Renamed Book")
+
+    def test_shared_author_and_genre_strings(self):
+        """Test books with equal authors and genres share the same string objects"""
+        other = Book(title="Other Book", author="".join(["Test ", "Author"]),
+                     copies=1, genre="".join(["Test ", "Genre"]), year=2024)
+        self.assertIs(other.author, self.valid_book.author)
+        self.assertIs(other.genre, self.valid_book.genre)
+
     def test_loan_operations(self):
         """Test book loan and return operations"""
         # Test successful loan
@@ -86,6 +107,7 @@ class TestBook(unittest.TestCase):
         # Test valid update
         self.valid_book.update_copies(5)
         self.assertEqual(self.valid_book.copies, 5)
+        self.assertEqual(self.valid_book.available_copies, 5)
 
         # Test update with negative number
         with self.assertRaises(ValueError):
@@ -95,6 +117,16 @@ class TestBook(unittest.TestCase):
         self.valid_book.loan()  # Loan one copy
         with self.assertRaises(ValueError):
             self.valid_book.update_copies(0)  # Should fail as one copy is loaned
+        self.assertEqual(self.valid_book.available_copies, 4)
+
+    def test_unchecked_matches_constructor(self):
+        """Test the trusted fast path builds the same book as the validating constructor"""
+        fast = Book._unchecked(title="Test Book", author="Test Author", genre="Test Genre",
+                               year=2024, copies=3, loaned_copies=1)
+        for attr in Book.__slots__:
+            if attr not in ('loaned_copies', 'available_copies'):
+                self.assertEqual(getattr(fast, attr), getattr(self.valid_book, attr), attr)
+        self.assertEqual(fast.available_copies, 2)
 
     def test_dictionary_conversion(self):
         """Test conversion to and from dictionary format"""
@@ -0,0 +1,66 @@
+import unittest
+from Library.book import Book
+from Library.book_decorator import (DigitalVersionDecorator,
+                                    AudioBookDecorator,
+                                    AwardWinnerDecorator,
+                                    AgeRecommendationDecorator)
+
+
+class TestBookDecorators(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.book = Book(title="The Hobbit", author="J.R.R. Tolkien", copies=5, genre="Fantasy", year=1937)
+
+    def test_decorator_chain(self):
+        """Test stacked decorators add their description lines and features in order"""
+        decorated = AwardWinnerDecorator(
+            AudioBookDecorator(DigitalVersionDecorator(self.book, ["PDF", "EPUB", "MOBI"]), "Andy Serkis", 11.5),
+            "Hugo Award", 1938
+        )
+        self.assertEqual(decorated.description, "\n".join([
+            "The Hobbit by J.R.R. Tolkien (1937)",
+            "Genre: Fantasy",
+            "Available in digital formats: PDF, EPUB, MOBI",
+            "Audiobook narrated by Andy Serkis (11.5 hours)",
+            "Hugo Award Winner (1938)",
+        ]))
+        self.assertEqual(decorated.description_lines(), decorated.description.split("\n"))
+        self.assertEqual(self.book.description_lines(), self.book.description.split("\n"))
+        self.assertEqual(decorated.special_features, [
+            "Digital Version (PDF, EPUB, MOBI)",
+            "Audiobook (11.5h)",
+            "Hugo Award (1938)",
+        ])
+
+    def test_decorators_follow_book_changes(self):
+        """Test decorators reflect edits to the wrapped book and return fresh feature lists"""
+        decorated = AgeRecommendationDecorator(self.book, 8, 12)
+        self.book.title = "The Hobbit, or There and Back Again"
+        self.assertEqual(decorated.title, "The Hobbit, or There and Back Again")
+        self.assertTrue(decorated.description.startswith("The Hobbit, or There and Back Again by"))
+
+        decorated.special_features.append("Changed")
+        self.assertEqual(decorated.special_features, ["Age Range: 8-12"])
+
+    def test_decorators_follow_own_attribute_changes(self):
+        """Test assigning a decorator's attributes re-formats its description line and feature"""
+        audio = AudioBookDecorator(self.book, "Rob Inglis", 11.0)
+        decorated = AgeRecommendationDecorator(audio, 8, 12)
+        decorated.max_age = None
+        audio.narrator = "Andy Serkis"
+        self.assertEqual(decorated.description.split("\n")[-2:], [
+            "Audiobook narrated by Andy Serkis (11.0 hours)",
+            "Recommended Age: 8+ years",
+        ])
+        self.assertEqual(decorated.special_features, ["Audiobook (11.0h)", "Age Range: 8+"])
+
+        formats = ["PDF"]
+        digital = DigitalVersionDecorator(self.book, formats)
+        formats.append("MOBI")
+        self.assertEqual(digital.special_features, ["Digital Version (PDF)"])
+        digital.formats = formats
+        self.assertEqual(digital.special_features, ["Digital Version (PDF, MOBI)"])
+
+
+if __name__ == '__main__':
+    unittest.main()
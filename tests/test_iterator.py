@@ -0,0 +1,72 @@
+import unittest
+from Library.book import Book
+from Library.book_iterator import (ChronologicalIterator,
+                                   AlphabeticalIterator,
+                                   GenreIterator,
+                                   AvailabilityIterator)
+
+
+class TestBookIterators(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.books = [
+            Book(title="Dune", author="Frank Herbert", copies=2, genre="Science Fiction", year=1965),
+            Book(title="Emma", author="Jane Austen", copies=1, genre="Romance", year=1815),
+            Book(title="Neuromancer", author="William Gibson", copies=1, genre="Science Fiction", year=1984),
+            Book(title="Persuasion", author="Jane Austen", copies=1, genre="Romance", year=1817),
+        ]
+        # Fully loan one book so availability filtering has something to exclude
+        self.books[2].loan()
+
+    def test_chronological_order(self):
+        """Test chronological iteration in both directions"""
+        years = [book.year for book in ChronologicalIterator(self.books)]
+        self.assertEqual(years, [1815, 1817, 1965, 1984])
+
+        years = [book.year for book in ChronologicalIterator(self.books, reverse=True)]
+        self.assertEqual(years, [1984, 1965, 1817, 1815])
+
+    def test_chronological_limit(self):
+        """Test limited chronological iteration returns only the first books"""
+        years = [book.year for book in ChronologicalIterator(self.books, limit=2)]
+        self.assertEqual(years, [1815, 1817])
+
+        years = [book.year for book in ChronologicalIterator(self.books, reverse=True, limit=2)]
+        self.assertEqual(years, [1984, 1965])
+
+    def test_alphabetical_order(self):
+        """Test alphabetical iteration by title and by author"""
+        titles = [book.title for book in AlphabeticalIterator(self.books)]
+        self.assertEqual(titles, ["Dune", "Emma", "Neuromancer", "Persuasion"])
+
+        authors = [book.author for book in AlphabeticalIterator(self.books, by_author=True)]
+        self.assertEqual(authors, ["Frank Herbert", "Jane Austen", "Jane Austen", "William Gibson"])
+
+        # Ordering ignores case
+        books = self.books + [Book(title="cryptonomicon", author="neal stephenson", copies=1, genre="Fiction", year=1999)]
+        titles = [book.title for book in AlphabeticalIterator(books)]
+        self.assertEqual(titles, ["cryptonomicon", "Dune", "Emma", "Neuromancer", "Persuasion"])
+
+    def test_genre_grouping(self):
+        """Test genre iteration groups books and tracks the current genre"""
+        iterator = GenreIterator(self.books)
+        seen = [(iterator.current_genre(), book.title) for book in iterator]
+        self.assertEqual(seen, [
+            ("Romance", "Emma"),
+            ("Romance", "Persuasion"),
+            ("Science Fiction", "Dune"),
+            ("Science Fiction", "Neuromancer"),
+        ])
+        self.assertIsNone(iterator.current_genre())
+
+    def test_availability_filter(self):
+        """Test availability iteration filters on loan status"""
+        available = [book.title for book in AvailabilityIterator(self.books)]
+        self.assertEqual(available, ["Dune", "Emma", "Persuasion"])
+
+        unavailable = [book.title for book in AvailabilityIterator(self.books, available_only=False)]
+        self.assertEqual(unavailable, ["Neuromancer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
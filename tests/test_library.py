@@ -1,75 +1,95 @@
+import contextlib
+import copy
+import csv
+import io
 import unittest
 import os
+import tempfile
+from types import MappingProxyType
+from typing import Dict
+from unittest import mock
 from Library.library_system import LibrarySystem
+from Library.book_factory import BookFactory
 from Library.book import Book
 import logging
 
 
+# Sample book data for tests; read-only so tests can't leak changes into each other
+_TEST_BOOK_DATA = MappingProxyType({
+    'title': "Test Book",
+    'author': "Test Author",
+    'copies': 3,
+    'genre': "Test Genre",
+    'year': 2024
+})
+
+
+def _data_files(test_dir: str) -> Dict[str, str]:
+    """LibrarySystem data file arguments for files inside test_dir"""
+    return {
+        'books_file': os.path.join(test_dir, "test_books.csv"),
+        'available_books_file': os.path.join(test_dir, "test_available_books.csv"),
+        'loaned_books_file': os.path.join(test_dir, "test_loaned_books.csv"),
+        'features_file': os.path.join(test_dir, "test_book_features.csv"),
+    }
+
+
+def _write_books_header(test_dir: str) -> str:
+    """Create an empty books CSV in test_dir and return its path"""
+    books_file = _data_files(test_dir)['books_file']
+    with open(books_file, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerow(Book.CSV_HEADER)
+    return books_file
+
+
+def _make_library(test_dir: str) -> LibrarySystem:
+    """Create a LibrarySystem whose data files live in test_dir, logging to os.devnull"""
+    return LibrarySystem(log_file=os.devnull, **_data_files(test_dir))
+
+
 class TestLibrarySystem(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build an empty template library once for the test case"""
+        # Drop log records before they are formatted or reach a handler
+        logging.disable(logging.CRITICAL)
+
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls._temp_dir = temp_dir.name
+
+        _write_books_header(cls._temp_dir)
+        cls._template_library = _make_library(cls._temp_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable logging and close the library's os.devnull log handler"""
+        logging.disable(logging.NOTSET)
+        library_logger = logging.getLogger('Library.library_system')
+        for handler in library_logger.handlers[:]:
+            library_logger.removeHandler(handler)
+            # The buffering handler does not close the file handler it flushes into
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+
     def setUp(self):
         """Set up test fixtures before each test method"""
-        # Create test directory in the Data folder
-        self.test_dir = "Data/test"
-        if not os.path.exists(self.test_dir):
-            os.makedirs(self.test_dir)
-
-        # Test file paths
-        self.test_books_file = os.path.join(self.test_dir, "test_books.csv")
-        self.test_available_file = os.path.join(self.test_dir, "test_available_books.csv")
-        self.test_loaned_file = os.path.join(self.test_dir, "test_loaned_books.csv")
-        self.test_log_file = os.path.join(self.test_dir, "test_library.txt")
-
-        # Initialize the test books file with an empty CSV
-        with open(self.test_books_file, 'w', encoding='utf-8') as f:
-            f.write("title,author,is_loaned,copies,genre,year\n")
-
-        # Initialize library system with test files
-        self.library = LibrarySystem(
-            books_file=self.test_books_file,
-            available_books_file=self.test_available_file,
-            loaned_books_file=self.test_loaned_file,
-            log_file=self.test_log_file
-        )
-
-        # Sample book data for tests
-        self.test_book_data = {
-            'title': "Test Book",
-            'author': "Test Author",
-            'copies': 3,
-            'genre': "Test Genre",
-            'year': 2024
-        }
-
-    def tearDown(self):
-        """Clean up after each test method"""
-        # Close any open log file handlers
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
-            handler.close()
+        # Give each test its own empty data files, removed with the class directory
+        self.test_dir = tempfile.mkdtemp(dir=self._temp_dir)
+        self.test_books_file = _write_books_header(self.test_dir)
 
-        # Remove test files
-        test_files = [
-            self.test_books_file,
-            self.test_available_file,
-            self.test_loaned_file,
-            self.test_log_file
-        ]
-        for file in test_files:
-            if os.path.exists(file):
-                os.remove(file)
-
-        # Remove test directory if empty
-        if os.path.exists(self.test_dir) and not os.listdir(self.test_dir):
-            os.rmdir(self.test_dir)
-            parent_dir = os.path.dirname(self.test_dir)
-            if os.path.exists(parent_dir) and not os.listdir(parent_dir):
-                os.rmdir(parent_dir)
+        # Clone the pristine template instead of loading a new library from disk
+        self.library = copy.deepcopy(self._template_library)
+        for name, path in _data_files(self.test_dir).items():
+            setattr(self.library, name, path)
 
     def test_add_book(self):
         """Test adding books to the library"""
         # Test adding a new book
         self.assertTrue(
-            self.library.add_book(**self.test_book_data),
+            self.library.add_book(**_TEST_BOOK_DATA),
             "Should successfully add a new book"
         )
 
@@ -77,17 +97,17 @@ class TestLibrarySystem(unittest.TestCase):
         books = self.library.get_all_books()
         self.assertEqual(len(books), 1, "Should have exactly one book")
         book = books[0]
-        for key, value in self.test_book_data.items():
+        for key, value in _TEST_BOOK_DATA.items():
             self.assertEqual(getattr(book, key), value)
 
     def test_remove_book(self):
         """Test removing books from the library"""
         # Add a book first
-        self.library.add_book(**self.test_book_data)
+        self.library.add_book(**_TEST_BOOK_DATA)
 
         # Test successful removal
         self.assertTrue(
-            self.library.remove_book(self.test_book_data['title']),
+            self.library.remove_book(_TEST_BOOK_DATA['title']),
             "Should successfully remove existing book"
         )
 
@@ -103,35 +123,51 @@ class TestLibrarySystem(unittest.TestCase):
     def test_loan_operations(self):
         """Test book loan and return operations"""
         # Add a test book
-        self.library.add_book(**self.test_book_data)
+        self.library.add_book(**_TEST_BOOK_DATA)
         test_user = "test_user"
 
         # Test successful loan
         self.assertTrue(
-            self.library.loan_book(self.test_book_data['title'], test_user),
+            self.library.loan_book(_TEST_BOOK_DATA['title'], test_user),
             "Should successfully loan available book"
         )
 
         # Verify loan status
-        book = self.library._get_book_case_insensitive(self.test_book_data['title'])
+        book = self.library._get_book_case_insensitive(_TEST_BOOK_DATA['title'])
         self.assertEqual(book.loaned_copies, 1)
         self.assertIn(test_user, self.library.user_loans)
 
         # Test successful return
         self.assertTrue(
-            self.library.return_book(self.test_book_data['title'], test_user),
+            self.library.return_book(_TEST_BOOK_DATA['title'], test_user),
             "Should successfully return loaned book"
         )
 
         # Verify return status
         self.assertEqual(book.loaned_copies, 0)
-        self.assertNotIn(self.test_book_data['title'], self.library.user_loans[test_user])
+        self.assertNotIn(_TEST_BOOK_DATA['title'], self.library.user_loans[test_user])
+
+    def test_case_insensitive_lookup(self):
+        """Test books can be found regardless of title case"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+
+        book = self.library._get_book_case_insensitive("test BOOK")
+        self.assertIsNotNone(book)
+        self.assertEqual(book.title, _TEST_BOOK_DATA['title'])
+
+        self.library.remove_book(_TEST_BOOK_DATA['title'])
+        self.assertIsNone(self.library._get_book_case_insensitive("test book"))
+
+        # Full case folding also matches titles whose lowercase forms differ
+        self.library.add_book(title="Die Straße", author="Test Author", copies=1, genre="Test Genre", year=2024)
+        book = self.library._get_book_case_insensitive("DIE STRASSE")
+        self.assertIsNotNone(book)
+        self.assertEqual(book.title, "Die Straße")
 
     def test_waiting_list(self):
         """Test waiting list functionality"""
         # Add a book with 1 copy
-        book_data = self.test_book_data.copy()
-        book_data['copies'] = 1
+        book_data = {**_TEST_BOOK_DATA, 'copies': 1}
         self.library.add_book(**book_data)
 
         # Loan the only copy
@@ -146,6 +182,8 @@ class TestLibrarySystem(unittest.TestCase):
         # Verify user2 is in waiting list before return
         waiting_list = self.library.get_waiting_list(book_data['title'])
         self.assertIn("user2", waiting_list, "User should be in waiting list before book return")
+        self.assertEqual(self.library.get_user_waiting_list_positions("user2"), {book_data['title']: 1})
+        self.assertEqual(self.library.get_user_waiting_list_positions("user3"), {})
 
         # Return the book
         self.library.return_book(book_data['title'], "user1")
@@ -158,6 +196,10 @@ class TestLibrarySystem(unittest.TestCase):
             "Waiting list should be empty after return as user is automatically removed and notified"
         )
 
+        # Verify user2 was told the book is available
+        notifications = self.library.notification_center.get_user_notifications("user2")
+        self.assertEqual(notifications[-1].type, 'BOOK_AVAILABLE')
+
         # Verify the book is available
         book = self.library._get_book_case_insensitive(book_data['title'])
         self.assertTrue(
@@ -165,10 +207,49 @@ class TestLibrarySystem(unittest.TestCase):
             "Book should be available after return"
         )
 
+    def test_reads_do_not_grow_lookups(self):
+        """Test failed returns and lookups leave the loan and waiting-list dicts untouched"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.assertFalse(self.library.return_book(_TEST_BOOK_DATA['title'], "nobody"))
+        self.assertFalse(self.library.remove_from_waiting_list(_TEST_BOOK_DATA['title'], "nobody"))
+        self.assertEqual(self.library.get_user_loans("nobody"), [])
+        self.assertEqual(len(self.library.get_waiting_list(_TEST_BOOK_DATA['title'])), 0)
+
+        self.assertNotIn("nobody", self.library.user_loans)
+        self.assertNotIn(_TEST_BOOK_DATA['title'], self.library.waiting_lists)
+
+    def test_notify_next_in_line(self):
+        """Test the first waiting user is told the book is available"""
+        book_data = {**_TEST_BOOK_DATA, 'copies': 1}
+        self.library.add_book(**book_data)
+        self.library.loan_book(book_data['title'], "user1")
+        self.library.loan_book(book_data['title'], "user2")
+
+        self.assertTrue(self.library.notify_next_in_line(book_data['title']))
+        notifications = self.library.notification_center.get_user_notifications("user2")
+        self.assertEqual(notifications[-1].type, 'BOOK_AVAILABLE')
+        self.assertEqual(notifications[-1].book_title, book_data['title'])
+
+    def test_notification_registration(self):
+        """Test users get a single observer that only receives their own notifications"""
+        self.library.register_user_for_notifications("user1")
+        observer = self.library.notification_center.get_user_observer("user1")
+        self.library.register_user_for_notifications("user1")
+        self.assertIs(self.library.notification_center.get_user_observer("user1"), observer)
+
+        self.library.register_user_for_notifications("user2")
+        self.library.book_notification_manager.notify_added_to_waiting_list("Test Book", "user2", 1)
+        self.assertEqual(observer.get_unread_notifications(), [])
+        other = self.library.notification_center.get_user_observer("user2")
+        self.assertEqual(len(other.get_unread_notifications()), 1)
+
+        self.library.unregister_user_from_notifications("user1")
+        self.assertIsNone(self.library.notification_center.get_user_observer("user1"))
+
     def test_get_available_books(self):
         """Test retrieving available books"""
         # Add two books with different availability
-        self.library.add_book(**self.test_book_data)  # 3 copies
+        self.library.add_book(**_TEST_BOOK_DATA)  # 3 copies
         self.library.add_book(
             title="Test Book 2",
             author="Test Author",
@@ -183,12 +264,253 @@ class TestLibrarySystem(unittest.TestCase):
         # Check available books
         available_books = self.library.get_available_books()
         self.assertEqual(len(available_books), 1)
-        self.assertEqual(available_books[0].title, self.test_book_data['title'])
+        self.assertEqual(available_books[0].title, _TEST_BOOK_DATA['title'])
+
+    def test_get_loaned_books(self):
+        """Test loaned and available books follow loans, returns and removals"""
+        self.library.add_book(**_TEST_BOOK_DATA)  # 3 copies
+        self.assertEqual(self.library.get_loaned_books(), [])
+
+        self.library.loan_book(_TEST_BOOK_DATA['title'], "user1")
+        self.assertEqual([book.title for book in self.library.get_loaned_books()], ["Test Book"])
+        self.assertEqual([book.title for book in self.library.get_available_books()], ["Test Book"])
+
+        self.library.return_book(_TEST_BOOK_DATA['title'], "user1")
+        self.assertEqual(self.library.get_loaned_books(), [])
+
+        self.library.remove_book(_TEST_BOOK_DATA['title'])
+        self.assertEqual(self.library.get_available_books(), [])
+
+    def test_get_all_titles(self):
+        """Test the cached title list follows additions, renames and removals"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        titles = self.library.get_all_titles()
+        self.assertEqual(titles, ("Test Book",))
+        self.assertIs(self.library.get_all_titles(), titles)
+
+        self.library.update_book("Test Book", {'title': "Renamed Book"})
+        self.assertEqual(self.library.get_all_titles(), ("Renamed Book",))
+        self.library.remove_book("Renamed Book")
+        self.assertEqual(self.library.get_all_titles(), ())
+
+    def test_popular_books(self):
+        """Test most wanted and most borrowed rankings skip books nobody asked for"""
+        self.library.add_book(**_TEST_BOOK_DATA)  # 3 copies
+        self.library.add_book("Rare Book", "Other Author", 1, "Fiction", 2001)
+        self.library.add_book("Unread Book", "Other Author", 1, "Fiction", 2002)
+
+        self.library.loan_book("Rare Book", "user1")
+        for user in ("user2", "user3"):
+            self.library.add_to_waiting_list("Rare Book", user)
+            self.library.loan_book("Test Book", user)
+        self.library.add_to_waiting_list("Test Book", "user4")
+
+        wanted = [(book.title, size) for book, size in self.library.get_most_wanted_books()]
+        self.assertEqual(wanted, [("Rare Book", 2), ("Test Book", 1)])
+        self.assertEqual([book.title for book, _ in self.library.get_most_wanted_books(1)], ["Rare Book"])
+
+        borrowed = [book.title for book in self.library.get_most_borrowed_books()]
+        self.assertEqual(borrowed, ["Test Book", "Rare Book"])
+        self.assertEqual([book.title for book in self.library.get_most_borrowed_books(1)], ["Test Book"])
+
+    def test_update_book_title(self):
+        """Test renaming a book re-keys it for exact and case-insensitive lookups"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.assertTrue(self.library.update_book("test book", {'title': "Renamed Book", 'author': "New Author"}))
+
+        self.assertNotIn("Test Book", self.library.books)
+        self.assertIsNone(self.library._get_book_case_insensitive("test book"))
+        book = self.library._get_book_case_insensitive("RENAMED BOOK")
+        self.assertIs(book, self.library.books["Renamed Book"])
+        self.assertEqual(book.author, "New Author")
+
+        # An invalid title is rejected without losing the book
+        self.assertFalse(self.library.update_book("Renamed Book", {'title': ""}))
+        self.assertIn("Renamed Book", self.library.books)
+
+    def test_iterator_cache_invalidation(self):
+        """Test cached iterators are rebuilt after the library changes"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+
+        iterator = self.library.get_iterator('availability', available_only=True)
+        again = self.library.get_iterator('availability', available_only=True)
+        self.assertIsNot(iterator, again, "Each request should get its own iterator")
+        self.assertIs(iterator._books, again._books, "Repeated requests should reuse the cached sort")
+        self.assertEqual([book.title for book in iterator], [_TEST_BOOK_DATA['title']])
+
+        # Loan every copy so the book drops out of the available view
+        for i in range(_TEST_BOOK_DATA['copies']):
+            self.library.loan_book(_TEST_BOOK_DATA['title'], f"user{i}")
+
+        iterator = self.library.get_iterator('availability', available_only=True)
+        self.assertEqual(list(iterator), [], "Iterator should reflect the loans")
+
+    def test_genre_iterator_snapshot(self):
+        """Test a held genre iterator is unaffected by later catalogue changes"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.library.add_book(title="Last Word", author="Test Author", copies=1, genre="Zzz", year=2024)
+        iterator = self.library.get_iterator('genre')
+
+        # Empty the 'Zzz' bucket and add to the other one
+        self.library.remove_book("Last Word")
+        self.library.add_book(title="Another Book", author="Test Author", copies=1, genre="Test Genre", year=2024)
+
+        self.assertEqual([book.title for book in iterator], [_TEST_BOOK_DATA['title'], "Last Word"])
+
+    def test_nested_genre_iterators(self):
+        """Test genre iterators from the cache keep their own current genre"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.library.add_book(title="Last Word", author="Test Author", copies=1, genre="Zzz", year=2024)
+
+        outer = self.library.get_iterator('genre')
+        seen = []
+        for book in outer:
+            # A full inner pass must not move the outer iterator's genre
+            list(self.library.get_iterator('genre'))
+            seen.append((outer.current_genre(), book.title))
+        self.assertEqual(seen, [("Test Genre", _TEST_BOOK_DATA['title']), ("Zzz", "Last Word")])
+
+    def test_popularity_iterator(self):
+        """Test popularity ordering follows waiting list sizes"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.library.add_book(title="Popular Book", author="Test Author", copies=1, genre="Test Genre", year=2024)
+
+        # Loan the only copy and queue two users for it
+        self.library.loan_book("Popular Book", "user1")
+        self.library.loan_book("Popular Book", "user2")
+        self.library.loan_book("Popular Book", "user3")
+
+        self.assertEqual(self.library.get_waiting_list_sizes(), {"Popular Book": 2})
+        titles = [book.title for book in self.library.get_iterator('popularity')]
+        self.assertEqual(titles, ["Popular Book", _TEST_BOOK_DATA['title']])
+
+    def test_genre_iterator(self):
+        """Test genre iteration follows the library's genre index"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.library.add_book(title="A Mystery", author="Test Author", copies=1, genre="Mystery", year=2020)
+        self.library.add_book(title="Another Mystery", author="Test Author", copies=1, genre="Mystery", year=2021)
+
+        iterator = self.library.get_iterator('genre')
+        self.assertEqual(
+            [(iterator.current_genre(), book.title) for book in iterator],
+            [("Mystery", "A Mystery"), ("Mystery", "Another Mystery"), ("Test Genre", "Test Book")]
+        )
+
+        # Moving a book to another genre re-buckets it
+        self.assertTrue(self.library.update_book("A Mystery", {'genre': "Test Genre"}))
+        iterator = self.library.get_iterator('genre')
+        self.assertEqual(
+            [(iterator.current_genre(), book.title) for book in iterator],
+            [("Mystery", "Another Mystery"), ("Test Genre", "A Mystery"), ("Test Genre", "Test Book")]
+        )
+
+    def test_bulk_defers_saving(self):
+        """Test book files are written once when the bulk block exits"""
+        with self.library.bulk():
+            self.library.add_book(**_TEST_BOOK_DATA)
+            self.library.add_book(title="Test Book 2", author="Test Author", copies=1, genre="Test Genre", year=2024)
+            with open(self.test_books_file, encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 1, "Only the header should be on disk inside bulk()")
+
+        with open(self.test_books_file, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 3, "Both books should be saved after bulk()")
+
+    def test_projections_keep_catalogue_order(self):
+        """Test available and loaned books stay in catalogue order across loans and returns"""
+        for title in ("Alpha", "Beta", "Gamma"):
+            self.library.add_book(title=title, author="Test Author", copies=1, genre="Test Genre", year=2024)
+
+        self.library.loan_book("Alpha", "user1")
+        self.library.loan_book("Gamma", "user2")
+        self.library.loan_book("Beta", "user3")
+        self.assertEqual([book.title for book in self.library.get_loaned_books()], ["Alpha", "Beta", "Gamma"])
+
+        self.library.return_book("Gamma", "user2")
+        self.library.return_book("Alpha", "user1")
+        self.assertEqual([book.title for book in self.library.get_available_books()], ["Alpha", "Gamma"])
+        with open(self.library.available_books_file, encoding='utf-8') as f:
+            self.assertEqual([line.split(',')[0] for line in f.read().splitlines()[1:]], ["Alpha", "Gamma"])
+
+    def test_rejected_update_changes_nothing(self):
+        """Test an update with one invalid field leaves the book, its projections and searches unchanged"""
+        self.library.add_book(title="Alpha", author="Test Author", copies=1, genre="Test Genre", year=2024)
+        self.library.add_book(**_TEST_BOOK_DATA)
+
+        self.assertFalse(self.library.update_book("Alpha", {'title': "Zeta", 'genre': ""}))
+
+        self.assertEqual(list(self.library.books), ["Alpha", _TEST_BOOK_DATA['title']])
+        self.assertEqual(self.library.books["Alpha"].genre, "Test Genre")
+        self.assertEqual([book.title for book in self.library.get_available_books()],
+                         ["Alpha", _TEST_BOOK_DATA['title']])
+        self.assertEqual([book.title for book in self.library.books_by_genre["Test Genre"]],
+                         ["Alpha", _TEST_BOOK_DATA['title']])
+        self.assertEqual(self.library.search_books('title', 'zeta'), [])
+        self.assertEqual([book.title for book in self.library.search_books('title', 'alp')], ["Alpha"])
+        with open(self.library.available_books_file, encoding='utf-8') as f:
+            self.assertIn("Alpha", f.read())
+
+    def test_load_skips_invalid_rows(self):
+        """Test hand-edited rows with missing fields or negative copies are skipped on load"""
+        with open(self.test_books_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([
+                ("Good Book", "Test Author", "No", 2, "Test Genre", 2024),
+                ("", "Test Author", "No", 1, "Test Genre", 2024),
+                ("No Author", "", "No", 1, "Test Genre", 2024),
+                ("No Genre", "Test Author", "No", 1, "", 2024),
+                ("Negative", "Test Author", "No", -1, "Test Genre", 2024),
+            ])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            library = _make_library(self.test_dir)
+        self.assertEqual(list(library.books), ["Good Book"])
+
+    def test_interrupted_save_removes_temporary_file(self):
+        """Test a save interrupted by any exception leaves neither a temporary file nor a partial file"""
+        books_file = os.path.join(self.test_dir, "saved_books.csv")
+        book = Book(title="Test Book", author="Test Author", copies=1, genre="Test Genre", year=2024)
+        with mock.patch('os.fsync', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                BookFactory.save_to_csv([book], books_file)
+        self.assertFalse(os.path.exists(books_file + '.tmp'))
+        self.assertFalse(os.path.exists(books_file))
+
+    def test_book_features_round_trip(self):
+        """Test book features are saved and loaded back"""
+        library = _make_library(self.test_dir)
+        library.add_book(**_TEST_BOOK_DATA)
+        self.assertTrue(library.update_book_features("Test Book", ["Audio", "Digital"]))
+
+        reloaded = _make_library(self.test_dir)
+        self.assertEqual(reloaded.get_book_features("Test Book"), ["Audio", "Digital"])
+
+    def test_prepared_search_uses_snapshot(self):
+        """Test a prepared search runs against the books as they were when it was prepared"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        run_search = self.library.prepare_search('title', 'test')
+
+        self.library.add_book(title="Test Two", author="Test Author", copies=1, genre="Test Genre", year=2024)
+        self.library.remove_book(_TEST_BOOK_DATA['title'])
+        self.assertEqual([book.title for book in run_search()], [_TEST_BOOK_DATA['title']])
+        self.assertEqual([book.title for book in self.library.search_books('title', 'test')], ["Test Two"])
+
+    def test_prepared_iterator_uses_snapshot(self):
+        """Test a prepared iterator is built from the books as they were when it was prepared"""
+        self.library.add_book(**_TEST_BOOK_DATA)
+        self.library.add_to_waiting_list(_TEST_BOOK_DATA['title'], "reader")
+        build_genre = self.library.prepare_iterator('genre')
+        build_popular = self.library.prepare_iterator('popularity', limit=1)
+
+        self.library.add_book(title="Test Two", author="Test Author", copies=1, genre="Test Genre", year=2024)
+        self.library.add_to_waiting_list("Test Two", "reader")
+        self.library.add_to_waiting_list("Test Two", "other")
+        self.assertEqual([book.title for book in build_genre()], [_TEST_BOOK_DATA['title']])
+        self.assertEqual([book.title for book in build_popular()], [_TEST_BOOK_DATA['title']])
+        self.assertEqual([book.title for book in self.library.get_iterator('popularity', limit=1)], ["Test Two"])
 
     def test_search_functionality(self):
         """Test book search functionality"""
         # Add test books
-        self.library.add_book(**self.test_book_data)
+        self.library.add_book(**_TEST_BOOK_DATA)
         self.library.add_book(
             title="Another Test",
             author="Different Author",
@@ -209,6 +531,23 @@ class TestLibrarySystem(unittest.TestCase):
         results = self.library.search_books('genre', 'Test Genre')
         self.assertEqual(len(results), 1)
 
+        # Searches reflect books added and removed after earlier searches
+        self.library.add_book("Third Test", "Other Author", 1, "Other Genre", 2022)
+        self.assertEqual(len(self.library.search_books('title', 'Test')), 3)
+        self.library.remove_book("Third Test")
+        self.assertEqual(len(self.library.search_books('title', 'Test')), 2)
+
+        # Searches ignore case, including after a field is updated
+        self.assertEqual(len(self.library.search_books('author', 'DIFFERENT')), 1)
+        self.library.update_book("Another Test", {'genre': "Mystery"})
+        self.assertEqual([book.title for book in self.library.search_books('genre', 'mystery')], ["Another Test"])
+
+        # Year searches are answered from an index too, and follow year updates
+        self.assertEqual([book.title for book in self.library.search_books('year', '2023')], ["Another Test"])
+        self.library.update_book("Another Test", {'year': 2020})
+        self.assertEqual(self.library.search_books('year', '2023'), [])
+        self.assertEqual(len(self.library.search_books('year', '2020')), 1)
+
         # Test search with no results
         results = self.library.search_books('title', 'Nonexistent')
         self.assertEqual(len(results), 0)
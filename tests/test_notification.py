@@ -0,0 +1,67 @@
+import unittest
+from datetime import datetime
+from Library.notification import (Observer,
+                                  Notification,
+                                  NotificationCenter,
+                                  UserNotificationObserver)
+
+
+class DetachingObserver(Observer):
+    """Observer that detaches itself when it receives a notification"""
+
+    def __init__(self, subject):
+        self.subject = subject
+        self.received = []
+
+    def update(self, notification):
+        self.received.append(notification)
+        self.subject.detach(self)
+
+
+class TestNotificationCenter(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.center = NotificationCenter()
+
+    def _notification(self, user):
+        return Notification(
+            type='BOOK_AVAILABLE',
+            message="The book 'Test Book' is now available for you to borrow",
+            timestamp=datetime.now(),
+            book_title="Test Book",
+            user=user
+        )
+
+    def test_observer_can_detach_during_notify(self):
+        """Test an observer detaching from update() does not break notification"""
+        observers = [DetachingObserver(self.center) for _ in range(3)]
+        for observer in observers:
+            self.center.attach(observer)
+        self.assertEqual(self.center.observer_count, 3)
+
+        self.center.add_notification(self._notification("user1"))
+        self.assertTrue(all(len(observer.received) == 1 for observer in observers))
+        self.assertEqual(self.center.observer_count, 0)
+
+        # Every observer detached itself, so later notifications reach none of them
+        self.center.add_notification(self._notification("user1"))
+        self.assertTrue(all(len(observer.received) == 1 for observer in observers))
+
+    def test_user_observer_receives_own_notifications(self):
+        """Test user observers only receive notifications addressed to their user"""
+        observer = UserNotificationObserver("user1")
+        self.center.attach(observer)
+        self.assertEqual(self.center.observer_count, 1)
+
+        self.center.add_notification(self._notification("user2"))
+        self.center.add_notification(self._notification("user1"))
+        self.assertEqual([n.user for n in observer.get_unread_notifications()], ["user1"])
+
+        self.center.detach(observer)
+        self.assertEqual(self.center.observer_count, 0)
+        self.center.add_notification(self._notification("user1"))
+        self.assertEqual(observer.get_unread_notifications(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from Library.book import Book
+from Library.search import SearchContext, TitleSearchStrategy, YearSearchStrategy
+
+
+class TestSearchContext(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.books = [
+            Book(title="The Hobbit", author="J.R.R. Tolkien", copies=1, genre="Fantasy", year=1937),
+            Book(title="Hobbit Lore", author="Anonymous", copies=1, genre="Reference", year=2001),
+            Book(title="Dune", author="Frank Herbert", copies=1, genre="Science Fiction", year=1965),
+            Book(title="Straße", author="Unknown", copies=1, genre="Fiction", year=1999),
+        ]
+        self.context = SearchContext()
+
+    def test_index_matches_linear_scan(self):
+        """Test indexed searches return exactly what a linear scan returns, in order"""
+        strategy = TitleSearchStrategy()
+        for query in ["", "h", "ob", "hobbit", "HOBBIT", "bbit l", "e", "strasse", "zzz", "hobbity"]:
+            self.assertEqual(self.context.search(self.books, 'title', query, version=1),
+                             strategy.search(self.books, query), query)
+
+    def test_year_index(self):
+        """Test year searches from the index match a scan and tolerate non-numeric queries"""
+        strategy = YearSearchStrategy()
+        for query in ["1937", "2001", "1800", "19x", ""]:
+            self.assertEqual(self.context.search(self.books, 'year', query, version=1),
+                             strategy.search(self.books, query), query)
+
+        # Results are copies, so changing them leaves the index intact
+        self.context.search(self.books, 'year', '1937', version=1).clear()
+        self.assertEqual(len(self.context.search(self.books, 'year', '1937', version=1)), 1)
+
+    def test_search_follows_books_and_version(self):
+        """Test unversioned searches see the books passed in and a new version rebuilds the index"""
+        self.assertEqual(len(self.context.search(self.books, 'genre', 'fiction')), 2)
+        self.assertEqual(len(self.context.search(self.books, 'genre', 'fiction', version=1)), 2)
+
+        self.books.append(Book(title="Emma", author="Jane Austen", copies=1, genre="Fiction", year=1815))
+        self.assertEqual(len(self.context.search(self.books, 'genre', 'fiction')), 3)
+        self.assertEqual(len(self.context.search(self.books[:1], 'genre', 'fiction')), 0)
+        self.assertEqual(len(self.context.search(self.books, 'genre', 'fiction', version=2)), 3)
+
+        # The index for a version is reused for later searches with that version
+        index = self.context._indexes[1]['genre']
+        self.context.search(self.books, 'genre', 'dune', version=2)
+        self.assertIs(self.context._indexes[1]['genre'], index)
+
+    def test_unknown_strategy(self):
+        """Test unknown strategies are rejected"""
+        with self.assertRaises(ValueError):
+            self.context.search(self.books, 'isbn', '123')
+
+
+if __name__ == '__main__':
+    unittest.main()
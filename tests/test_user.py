@@ -1,21 +1,43 @@
+import copy
 import unittest
 import os
+import tempfile
+from unittest import mock
+from Library import user_management
 from Library.user_management import UserManager
 
+# Cheap scrypt parameters for the default method; real hashes spend most of the suite's time
+_FAST_HASH_METHODS = {'scrypt': 'scrypt:1024:8:1'}
+_real_hash_password = user_management._hash_password
+
+
+def _fast_hash_password(password: str, method: str) -> str:
+    """Hash like _hash_password, but with a low work factor for the default method"""
+    return _real_hash_password(password, _FAST_HASH_METHODS.get(method, method))
+
 
 class TestUserManagement(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the users file and a shared UserManager once for the test case"""
+        for patcher in (mock.patch.object(user_management, '_hash_password', _fast_hash_password),
+                        mock.patch.dict(UserManager._dummy_hashes, clear=True)):
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+        # Use a private directory so test runs can't collide on the same files
+        temp_dir = tempfile.TemporaryDirectory(prefix="lms_users_")
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls._users_file = os.path.join(temp_dir.name, "test_users.csv")
+        cls._user_manager = UserManager(users_file=cls._users_file)
+
     def setUp(self):
         """Set up test fixtures before each test method"""
-        # Create test directory in the 'Data' folder
-        self.test_dir = "Data/test"
-        if not os.path.exists(self.test_dir):
-            os.makedirs(self.test_dir)
-
-        # Use a test-specific CSV file
-        self.test_users_file = os.path.join(self.test_dir, "test_users.csv")
-
-        # Initialize UserManager with test file
-        self.user_manager = UserManager(users_file=self.test_users_file)
+        self.test_users_file = self._users_file
+        self.user_manager = self._user_manager
+        # Snapshot the users, records included, so tearDown can roll back this test's
+        # changes even to users it modified in place (e.g. a rehash on login)
+        self._users_snapshot = copy.deepcopy(self.user_manager.users)
 
         # Test credentials
         self.test_username = "testuser"
@@ -23,16 +45,9 @@ class TestUserManagement(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after each test method"""
-        # Remove test file
-        if os.path.exists(self.test_users_file):
-            os.remove(self.test_users_file)
-        # Remove test directory
-        if os.path.exists(self.test_dir):
-            os.rmdir(self.test_dir)
-        # Remove parent test directory if empty
-        parent_dir = os.path.dirname(self.test_dir)
-        if os.path.exists(parent_dir) and not os.listdir(parent_dir):
-            os.rmdir(parent_dir)
+        # Restore the shared manager and rewrite the file to match it
+        self.user_manager.users = self._users_snapshot
+        self.user_manager.compact()
 
     def test_user_registration(self):
         """Test user registration functionality"""
@@ -130,8 +145,12 @@ class TestUserManagement(unittest.TestCase):
             ("user3", "pass3")
         ]
 
-        for username, password in test_users:
-            self.user_manager.register(username, password)
+        # Register them in one batch; the rows reach the file when the block exits
+        with self.user_manager.bulk():
+            for username, password in test_users:
+                self.user_manager.register(username, password)
+            with open(self.test_users_file, encoding='utf-8') as file:
+                self.assertEqual(len(file.readlines()), 1, "Only the header should be on disk inside bulk()")
 
         # Create new UserManager instance to read from file
         new_manager = UserManager(self.test_users_file)
@@ -143,12 +162,52 @@ class TestUserManagement(unittest.TestCase):
                 f"User {username} should be retrievable after persistence"
             )
 
+    def test_user_log_replay_and_compaction(self):
+        """Test deletions persist through the users log and reloading compacts it"""
+        for username in ("user1", "user2", "user3"):
+            self.user_manager.register(username, "password")
+        self.user_manager.delete_user("user1")
+        self.user_manager.delete_user("user2")
+
+        # 5 rows for 1 live user, so loading replays the log and then compacts it
+        new_manager = UserManager(self.test_users_file)
+        self.assertEqual(new_manager.get_all_users(), ["user3"])
+        with open(self.test_users_file, encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 2, "Compacted file should hold the header and one user")
+        self.assertTrue(new_manager.authenticate("user3", "password"))
+
+    def test_empty_users_file(self):
+        """Test an empty users file gets a header, so users registered into it load again"""
+        open(self.test_users_file, 'w').close()
+        manager = UserManager(self.test_users_file)
+        manager.register(self.test_username, self.test_password)
+
+        reloaded = UserManager(self.test_users_file)
+        self.assertEqual(reloaded.get_all_users(), [self.test_username])
+        self.assertTrue(reloaded.authenticate(self.test_username, self.test_password))
+
+    def test_rehash_on_login(self):
+        """Test hashes made with other parameters are upgraded on successful login"""
+        legacy_manager = UserManager(self.test_users_file, hash_method='pbkdf2:sha256:1000')
+        legacy_manager.register(self.test_username, self.test_password)
+
+        new_manager = UserManager(self.test_users_file)
+        self.assertTrue(new_manager.get_user(self.test_username).password_hash.startswith('pbkdf2:'))
+        self.assertTrue(new_manager.authenticate(self.test_username, self.test_password))
+        self.assertTrue(new_manager.get_user(self.test_username).password_hash.startswith('scrypt:'))
+
+        # The upgraded hash is persisted and still verifies
+        reloaded = UserManager(self.test_users_file)
+        self.assertTrue(reloaded.get_user(self.test_username).password_hash.startswith('scrypt:'))
+        self.assertTrue(reloaded.authenticate(self.test_username, self.test_password))
+
     def test_get_all_users(self):
         """Test retrieving all users"""
         # Register multiple users
         test_users = ["user1", "user2", "user3"]
-        for username in test_users:
-            self.user_manager.register(username, "password")
+        with self.user_manager.bulk():
+            for username in test_users:
+                self.user_manager.register(username, "password")
 
         # Get all users
         all_users = self.user_manager.get_all_users()